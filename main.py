@@ -18,6 +18,7 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path.parent))
 
 from src.controllers import MainController
+from src.views import apply_default_font
 from src.utils import setup_root_logger, get_logger, get_app_icon
 
 
@@ -38,6 +39,7 @@ def main():
     app.setOrganizationName("Lucien")
     app.setApplicationVersion("1.1.0")
     app.setWindowIcon(get_app_icon())
+    apply_default_font(app)
     
     controller = MainController()
     controller.show()
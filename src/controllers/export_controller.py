@@ -115,7 +115,11 @@ class ExportController(QObject):
     
     def _start_export_process(self, settings: dict, parent_widget):
         """Start the actual export process."""
-        self._progress_dialog = ProgressDialog("Exporting...", parent_widget)
+        # Reuse the dialog across exports rather than rebuilding its widgets
+        if self._progress_dialog is None:
+            self._progress_dialog = ProgressDialog("Exporting...", parent_widget)
+        else:
+            self._progress_dialog.reset("Exporting...")
         
         self._exporter = VideoExporter()
         self._exporter.set_renderer(self._renderer)
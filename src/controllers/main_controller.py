@@ -72,7 +72,7 @@ class MainController(QObject):
         
         panel = window.parameter_panel
         panel.config_changed.connect(self._on_config_changed)
-        panel.restore_object_requested.connect(self._restore_object)
+        panel.restore_objects_requested.connect(self._restore_objects)
         panel.restore_all_requested.connect(self._restore_all_objects)
         
         self._preview_controller.object_clicked.connect(self._on_object_clicked)
@@ -363,9 +363,9 @@ class MainController(QObject):
                 
                 self._preview_controller.update_preview()
     
-    def _restore_object(self, obj_id: int):
-        """Restore a hidden object."""
-        self._object_manager.restore_object(obj_id)
+    def _restore_objects(self, obj_ids: list):
+        """Restore hidden objects."""
+        self._object_manager.restore_objects(obj_ids)
         self._preview_controller.update_preview()
     
     def _restore_all_objects(self):
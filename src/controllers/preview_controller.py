@@ -4,6 +4,8 @@ Preview controller.
 Manages preview rendering, playback, and frame navigation.
 """
 
+import cv2
+import numpy as np
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from ..models import (
@@ -28,6 +30,9 @@ class PreviewController(QObject):
     frame_rendered = pyqtSignal(int)
     object_clicked = pyqtSignal(int, int, int)
     
+    # Frames wider than this are shown at half resolution while scrubbing
+    SCRUB_DOWNSAMPLE_MIN_WIDTH = 1280
+    
     def __init__(
         self,
         preview_widget: PreviewWidget,
@@ -159,8 +164,7 @@ class PreviewController(QObject):
                 draw_labels=False,
                 include_colorbar_area=False
             )
-            pixmap = numpy_to_qpixmap(frame)
-            self._preview.set_image(pixmap)
+            self._show_frame(frame)
             self._update_overlay_items()
         else:
             # Final mode: exact export preview with all labels drawn
@@ -169,11 +173,24 @@ class PreviewController(QObject):
                 draw_labels=True,
                 include_colorbar_area=True
             )
-            pixmap = numpy_to_qpixmap(frame)
-            self._preview.set_image(pixmap)
+            self._show_frame(frame)
         
         self.frame_rendered.emit(self._current_frame)
     
+    def _show_frame(self, frame: np.ndarray):
+        """Convert a rendered frame and hand it to the preview."""
+        height, width = frame.shape[:2]
+        if self._preview.is_scrubbing and width > self.SCRUB_DOWNSAMPLE_MIN_WIDTH:
+            # Halve the frame before conversion while scrubbing; the
+            # preview stretches it back over the full-size scene
+            frame = cv2.resize(
+                frame, (width // 2, height // 2),
+                interpolation=cv2.INTER_NEAREST
+            )
+            self._preview.set_image(numpy_to_qpixmap(frame), (width, height))
+        else:
+            self._preview.set_image(numpy_to_qpixmap(frame))
+    
     def _update_overlay_items(self):
         """Update overlay item appearances based on config."""
         cfg = self._config
@@ -18,6 +18,13 @@ logger = get_logger(__name__)
 
 GOLDEN_ANGLE = 137.50776405003785
 
+# Colormaps offered in the UI (fixed, so built once)
+RECOMMENDED_COLORMAPS = (
+    'viridis', 'plasma', 'inferno', 'magma', 'cividis',
+    'jet', 'turbo', 'rainbow', 'coolwarm', 'RdYlBu',
+    'hot', 'cool', 'spring', 'summer', 'autumn', 'winter',
+)
+
 
 class ColorMapper:
     """
@@ -215,9 +222,4 @@ class ColorMapper:
         Returns:
             List of colormap names.
         """
-        recommended = [
-            'viridis', 'plasma', 'inferno', 'magma', 'cividis',
-            'jet', 'turbo', 'rainbow', 'coolwarm', 'RdYlBu',
-            'hot', 'cool', 'spring', 'summer', 'autumn', 'winter',
-        ]
-        return recommended
+        return list(RECOMMENDED_COLORMAPS)
@@ -628,13 +628,12 @@ class FrameRenderer:
         qt_font.setPixelSize(cfg.font_size)
         qt_font.setBold(cfg.font_bold)
         qt_fm = QFontMetrics(qt_font)
-        qt_text_rect = qt_fm.boundingRect(text)
         
         return self._draw_text(
             image, text, (x, y),
             cfg.font_family, cfg.font_size, cfg.font_bold, color,
-            qt_text_width=qt_text_rect.width(),
-            qt_text_height=qt_text_rect.height()
+            qt_text_width=qt_fm.horizontalAdvance(text),
+            qt_text_height=qt_fm.height()
         )
     
     def _draw_scale_bar(
@@ -761,13 +760,12 @@ class FrameRenderer:
         qt_font.setPixelSize(cfg.font_size)
         qt_font.setBold(cfg.font_bold)
         qt_fm = QFontMetrics(qt_font)
-        qt_text_rect = qt_fm.boundingRect(speed_text)
         
         return self._draw_text(
             image, speed_text, (x, y),
             cfg.font_family, cfg.font_size, cfg.font_bold, color,
-            qt_text_width=qt_text_rect.width(),
-            qt_text_height=qt_text_rect.height()
+            qt_text_width=qt_fm.horizontalAdvance(speed_text),
+            qt_text_height=qt_fm.height()
         )
     
     def _calculate_colorbar_bounds(
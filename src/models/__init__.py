@@ -13,6 +13,7 @@ from .config_model import (
     ColorbarConfig,
     OutputConfig,
     VisualizationConfig,
+    format_speed_ratio,
 )
 from .data_manager import DataManager
 from .trajectory_calculator import TrajectoryCalculator
@@ -30,6 +31,7 @@ __all__ = [
     'ColorbarConfig',
     'OutputConfig',
     'VisualizationConfig',
+    'format_speed_ratio',
     'DataManager',
     'TrajectoryCalculator',
     'ObjectManager',
@@ -6,6 +6,7 @@ Defines dataclasses for all visualization settings with JSON serialization suppo
 
 import json
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -14,6 +15,28 @@ from ..utils import get_logger
 logger = get_logger(__name__)
 
 
+# Speed ratio formats indexed by (ratio >= 1) + (whole multiple)
+_RATIO_FORMATS = ("{:.2f}×".format, "{:.1f}×".format, "{:d}×".format)
+
+
+@lru_cache(maxsize=64)
+def format_speed_ratio(ratio: float) -> str:
+    """
+    Format a playback speed ratio for display, e.g. "2×", "1.5×" or "0.25×".
+    
+    Cached because spinning the output FPS revisits the same few values.
+    
+    Args:
+        ratio: Output FPS divided by original FPS.
+        
+    Returns:
+        Formatted ratio text.
+    """
+    whole = ratio >= 1 and ratio == int(ratio)
+    fmt = _RATIO_FORMATS[(ratio >= 1) + whole]
+    return fmt(int(ratio) if whole else ratio)
+
+
 @dataclass
 class GlobalConfig:
     """Global settings."""
@@ -266,11 +289,4 @@ class VisualizationConfig:
     
     def get_speed_ratio_text(self) -> str:
         """Get formatted playback speed ratio text."""
-        ratio = self.get_speed_ratio()
-        if ratio >= 1:
-            if ratio == int(ratio):
-                return f"{int(ratio)}×"
-            else:
-                return f"{ratio:.1f}×"
-        else:
-            return f"{ratio:.2f}×"
+        return format_speed_ratio(self.get_speed_ratio())
@@ -116,6 +116,23 @@ class ObjectManager(QObject):
             logger.info(f"Object {obj_id} restored")
             self.records_changed.emit()
     
+    def restore_objects(self, obj_ids: list[int]):
+        """
+        Restore several hidden objects with a single records_changed.
+        
+        Args:
+            obj_ids: Object IDs to restore.
+        """
+        ids = set(obj_ids)
+        before_count = len(self._hidden_records)
+        self._hidden_records = [
+            r for r in self._hidden_records if r.obj_id not in ids
+        ]
+        
+        if len(self._hidden_records) < before_count:
+            logger.info(f"Objects {sorted(ids)} restored")
+            self.records_changed.emit()
+    
     def restore_all(self):
         """Restore all hidden objects."""
         if self._hidden_records:
@@ -5,6 +5,7 @@ Provides functions for file dialogs, path handling, and file operations.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from PyQt6.QtWidgets import QFileDialog, QWidget, QMessageBox
@@ -16,10 +17,14 @@ from .natural_sort import natural_sort_paths
 SUPPORTED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp'}
 
 
+@lru_cache(maxsize=1)
 def get_app_icon() -> QIcon:
     """
     Load and return the application icon.
     
+    The icon is loaded once and shared by all windows and dialogs, so
+    the first call must happen after the QApplication has been created.
+    
     Returns:
         QIcon: Application icon loaded from SVG file.
     """
@@ -2,7 +2,7 @@
 View layer for Motion Visualization.
 """
 
-from .styles import get_application_style
+from .styles import get_application_style, apply_default_font
 from .graphics_items import (
     DraggableItem,
     DraggableTextLabel,
@@ -19,6 +19,7 @@ from .main_window import MainWindow
 
 __all__ = [
     'get_application_style',
+    'apply_default_font',
     'DraggableItem',
     'DraggableTextLabel',
     'DraggableScaleBar',
@@ -98,7 +98,7 @@ class DataLoadDialog(QDialog):
         
         # Original info label
         self._original_info_label = QLabel("")
-        self._original_info_label.setStyleSheet("color: #666; font-style: italic; margin-left: 105px;")
+        self._original_info_label.setObjectName("indentedHintLabel")
         required_layout.addWidget(self._original_info_label)
         
         # Mask images
@@ -120,7 +120,7 @@ class DataLoadDialog(QDialog):
         
         # Mask info label
         self._mask_info_label = QLabel("")
-        self._mask_info_label.setStyleSheet("color: #666; font-style: italic; margin-left: 105px;")
+        self._mask_info_label.setObjectName("indentedHintLabel")
         required_layout.addWidget(self._mask_info_label)
         
         layout.addWidget(required_group)
@@ -197,7 +197,7 @@ class DataLoadDialog(QDialog):
         
         # File type info label
         self._file_type_label = QLabel("")
-        self._file_type_label.setStyleSheet("color: #666; font-style: italic;")
+        self._file_type_label.setObjectName("hintLabel")
         column_layout.addRow("", self._file_type_label)
         
         # Separator
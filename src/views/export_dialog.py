@@ -6,17 +6,22 @@ Dialog for configuring video and image sequence export options.
 
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QRegularExpression
+from PyQt6.QtGui import QRegularExpressionValidator
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QCheckBox, QComboBox,
-    QGroupBox, QFormLayout, QFileDialog, QMessageBox,
-    QDoubleSpinBox
+    QGroupBox, QFormLayout, QFileDialog, QMessageBox
 )
 
+from ..models import format_speed_ratio
 from ..utils import get_app_icon
 
 
+# Characters that are not allowed in file or folder names on Windows
+_FILENAME_PATTERN = QRegularExpression(r'[^<>:"/\\|?*\x00-\x1F]+')
+
+
 class ExportDialog(QDialog):
     """
     Dialog for configuring export settings.
@@ -25,6 +30,8 @@ class ExportDialog(QDialog):
     and image sequence settings.
     """
     
+    _PREVIEW_TEMPLATE = "{p}000001.png, {p}000002.png, ..."
+    
     def __init__(self, parent=None):
         """Initialize export dialog."""
         super().__init__(parent)
@@ -55,7 +62,7 @@ class ExportDialog(QDialog):
         dir_layout = QHBoxLayout()
         
         dir_label = QLabel("Output Directory:")
-        dir_label.setStyleSheet("font-weight: 600;")
+        dir_label.setObjectName("sectionLabel")
         dir_layout.addWidget(dir_label)
         
         self._dir_edit = QLineEdit()
@@ -74,13 +81,15 @@ class ExportDialog(QDialog):
         
         self._video_check = QCheckBox("Export Video")
         self._video_check.setChecked(True)
-        self._video_check.toggled.connect(self._on_video_toggled)
         video_layout.addWidget(self._video_check)
         
         video_form = QFormLayout()
         video_form.setSpacing(12)
         
         self._video_name_edit = QLineEdit("output")
+        self._video_name_edit.setValidator(
+            QRegularExpressionValidator(_FILENAME_PATTERN, self)
+        )
         video_form.addRow("Filename:", self._video_name_edit)
         
         self._format_combo = QComboBox()
@@ -89,13 +98,16 @@ class ExportDialog(QDialog):
         
         # Output FPS is set in parameter panel, display here for reference
         self._output_fps_label = QLabel("30.0 fps")
-        self._output_fps_label.setStyleSheet("color: #0066cc; font-weight: bold;")
+        self._output_fps_label.setObjectName("valueLabel")
         video_form.addRow("Output FPS:", self._output_fps_label)
         
         self._speed_ratio_label = QLabel("30.0×")
-        self._speed_ratio_label.setStyleSheet("color: #666; font-style: italic;")
+        self._speed_ratio_label.setObjectName("hintLabel")
         video_form.addRow("Speed Ratio:", self._speed_ratio_label)
         
+        self._video_check.toggled.connect(self._video_name_edit.setEnabled)
+        self._video_check.toggled.connect(self._format_combo.setEnabled)
+        
         video_layout.addLayout(video_form)
         layout.addWidget(video_group)
         
@@ -104,25 +116,32 @@ class ExportDialog(QDialog):
         
         self._image_check = QCheckBox("Export Image Sequence")
         self._image_check.setChecked(True)
-        self._image_check.toggled.connect(self._on_image_toggled)
         image_layout.addWidget(self._image_check)
         
         image_form = QFormLayout()
         image_form.setSpacing(12)
         
         self._subfolder_edit = QLineEdit("frames")
+        self._subfolder_edit.setValidator(
+            QRegularExpressionValidator(_FILENAME_PATTERN, self)
+        )
         image_form.addRow("Subfolder:", self._subfolder_edit)
         
         self._prefix_edit = QLineEdit("frame_")
+        self._prefix_edit.setValidator(
+            QRegularExpressionValidator(_FILENAME_PATTERN, self)
+        )
         image_form.addRow("Filename Prefix:", self._prefix_edit)
         
         preview_label = QLabel()
-        preview_label.setStyleSheet("color: #666; font-style: italic;")
+        preview_label.setObjectName("hintLabel")
         self._preview_label = preview_label
         self._update_preview()
         image_form.addRow("Preview:", preview_label)
         
         self._prefix_edit.textChanged.connect(self._update_preview)
+        self._image_check.toggled.connect(self._subfolder_edit.setEnabled)
+        self._image_check.toggled.connect(self._prefix_edit.setEnabled)
         
         image_layout.addLayout(image_form)
         layout.addWidget(image_group)
@@ -148,49 +167,41 @@ class ExportDialog(QDialog):
         layout.addLayout(button_layout)
     
     def _browse_directory(self):
-        """Open directory selection dialog."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Output Directory",
-            self._output_dir or "",
-            QFileDialog.Option.ShowDirsOnly
-        )
+        """
+        Open directory selection dialog.
         
+        Uses a non-blocking, non-native dialog so that slow or network
+        filesystems do not stall the event loop while folders are listed.
+        """
+        dialog = QFileDialog(self, "Select Output Directory", self._output_dir or "")
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+        dialog.setOption(QFileDialog.Option.DontUseNativeDialog)
+        dialog.fileSelected.connect(self._on_directory_selected)
+        dialog.open()
+    
+    def _on_directory_selected(self, directory: str):
+        """Handle directory chosen in the selection dialog."""
         if directory:
             self._output_dir = directory
             self._dir_edit.setText(directory)
     
-    def _on_video_toggled(self, checked: bool):
-        """Handle video export checkbox toggle."""
-        self._video_name_edit.setEnabled(checked)
-        self._format_combo.setEnabled(checked)
-    
     def _update_speed_ratio(self):
         """Update speed ratio display based on output and original FPS."""
         if self._original_fps <= 0:
             self._speed_ratio_label.setText("N/A")
             return
         
-        ratio = self._output_fps / self._original_fps
-        if ratio >= 1:
-            if ratio == int(ratio):
-                text = f"{int(ratio)}×"
-            else:
-                text = f"{ratio:.1f}×"
-        else:
-            text = f"{ratio:.2f}×"
-        
-        self._speed_ratio_label.setText(text)
-    
-    def _on_image_toggled(self, checked: bool):
-        """Handle image export checkbox toggle."""
-        self._subfolder_edit.setEnabled(checked)
-        self._prefix_edit.setEnabled(checked)
+        self._speed_ratio_label.setText(
+            format_speed_ratio(self._output_fps / self._original_fps)
+        )
     
     def _update_preview(self):
         """Update filename preview."""
-        prefix = self._prefix_edit.text() or "frame_"
-        self._preview_label.setText(f"{prefix}000001.png, {prefix}000002.png, ...")
+        self._preview_label.setText(
+            self._PREVIEW_TEMPLATE.format(p=self._prefix_edit.text() or "frame_")
+        )
     
     def _on_export(self):
         """Handle export button click."""
@@ -202,7 +213,10 @@ class ExportDialog(QDialog):
             )
             return
         
-        if not self._video_check.isChecked() and not self._image_check.isChecked():
+        video_on = self._video_check.isChecked()
+        image_on = self._image_check.isChecked()
+        
+        if not video_on and not image_on:
             QMessageBox.warning(
                 self,
                 "No Export Selected",
@@ -210,12 +224,12 @@ class ExportDialog(QDialog):
             )
             return
         
-        self._export_video = self._video_check.isChecked()
+        self._export_video = video_on
         self._video_filename = self._video_name_edit.text() or "output"
         self._video_format = self._format_combo.currentText()
         # output_fps is already set via set_defaults from config
         
-        self._export_images = self._image_check.isChecked()
+        self._export_images = image_on
         self._subfolder_name = self._subfolder_edit.text() or "frames"
         self._image_prefix = self._prefix_edit.text() or "frame_"
         
@@ -5,13 +5,58 @@ Provides draggable label items for time, scale bar, speed label,
 and colorbar that can be positioned by the user.
 """
 
-from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QPointF
-from PyQt6.QtGui import QPainter, QFont, QColor, QPen, QBrush
+import numpy as np
+from PyQt6.QtCore import Qt, QRectF, QLineF, QTimer, pyqtSignal, QPointF
+from PyQt6.QtGui import (
+    QPainter, QFont, QFontMetrics, QColor, QPen, QBrush, QPixmap,
+    QStaticText, QTransform
+)
 from PyQt6.QtWidgets import (
     QGraphicsItem, QGraphicsObject, QGraphicsRectItem,
     QStyleOptionGraphicsItem, QWidget
 )
 
+from ..utils import numpy_to_qpixmap
+
+
+_FONT_CACHE: dict[tuple[str, int, bool], QFont] = {}
+_FONT_METRICS_CACHE: dict[tuple[str, int, bool], QFontMetrics] = {}
+
+
+def _get_font(family: str, pixel_size: int, bold: bool = False) -> QFont:
+    """
+    Get a shared font for the given settings.
+    
+    Fonts use pixel size for DPI independence. Returned fonts are shared
+    between items and must not be modified.
+    """
+    key = (family, pixel_size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QFont(family)
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        _FONT_CACHE[key] = font
+    return font
+
+
+def _get_font_metrics(font: QFont) -> QFontMetrics:
+    """Get shared font metrics for a font, keyed like the font cache."""
+    key = (font.family(), font.pixelSize(), font.bold())
+    metrics = _FONT_METRICS_CACHE.get(key)
+    if metrics is None:
+        metrics = QFontMetrics(font)
+        _FONT_METRICS_CACHE[key] = metrics
+    return metrics
+
+
+def _make_static_text(text: str, font: QFont) -> QStaticText:
+    """Create plain static text with its glyph layout prepared for font."""
+    static_text = QStaticText(text)
+    static_text.setTextFormat(Qt.TextFormat.PlainText)
+    static_text.prepare(QTransform(), font)
+    return static_text
+
 
 class DraggableItem(QGraphicsObject):
     """
@@ -22,10 +67,13 @@ class DraggableItem(QGraphicsObject):
     
     Signals:
         position_changed(str, float, float): Item name, relative x, relative y.
+            Emitted at most once per POSITION_EMIT_INTERVAL_MS while dragging.
     """
     
     position_changed = pyqtSignal(str, float, float)
     
+    POSITION_EMIT_INTERVAL_MS = 16
+    
     def __init__(self, name: str, parent=None):
         """
         Initialize draggable item.
@@ -36,27 +84,62 @@ class DraggableItem(QGraphicsObject):
         """
         super().__init__(parent)
         
-        self._name = name
-        self._image_width = 100
-        self._image_height = 100
-        self._relative_x = 0.0
-        self._relative_y = 0.0
+        self._name: str = name
+        self._image_width: int = 100
+        self._image_height: int = 100
+        self._relative_x: float = 0.0
+        self._relative_y: float = 0.0
+        self._bounding_rect = QRectF()
+        
+        # Geometry recalculation is deferred while a batch is open
+        self._in_batch: bool = False
+        self._geometry_pending: bool = False
         
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
+        # Populate option.exposedRect so paint can skip unexposed regions
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
         self.setCursor(Qt.CursorShape.SizeAllCursor)
         self.setAcceptHoverEvents(True)
         
-        self._is_hovered = False
+        self._is_hovered: bool = False
+        
+        # Coalesce position updates during drags to ~60 Hz
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.POSITION_EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._flush_position)
     
     @property
     def name(self) -> str:
         """Get item name."""
         return self._name
     
+    def begin_batch(self):
+        """Defer geometry recalculation until end_batch() is called."""
+        self._in_batch = True
+    
+    def end_batch(self):
+        """Apply any geometry change deferred since begin_batch()."""
+        self._in_batch = False
+        if self._geometry_pending:
+            self._geometry_pending = False
+            self._update_size()
+    
+    def _defer_geometry(self) -> bool:
+        """Record a pending geometry update if a batch is open."""
+        if self._in_batch:
+            self._geometry_pending = True
+        return self._in_batch
+    
+    def _update_size(self):
+        """Recalculate the bounding rect; implemented by subclasses."""
+    
     def set_image_size(self, width: int, height: int):
         """Set reference image size for relative positioning."""
+        if width == self._image_width and height == self._image_height:
+            return
         self._image_width = width
         self._image_height = height
         
@@ -87,26 +170,42 @@ class DraggableItem(QGraphicsObject):
     def itemChange(self, change, value):
         """Handle item changes, particularly position updates."""
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
-            pos = value
-            
             if self._image_width > 0 and self._image_height > 0:
-                self._relative_x = pos.x() / self._image_width
-                self._relative_y = pos.y() / self._image_height
-                
                 # Allow items to be placed outside image boundaries
                 # to support colorbar placement outside original image area
                 # The image will be extended in final preview mode
                 # Limit to reasonable range (-0.5 to 2.0) to prevent
                 # items from being dragged too far off-screen
-                self._relative_x = max(-0.5, min(2.0, self._relative_x))
-                self._relative_y = max(-0.5, min(2.0, self._relative_y))
+                rel_x = min(max(value.x() / self._image_width, -0.5), 2.0)
+                rel_y = min(max(value.y() / self._image_height, -0.5), 2.0)
+                
+                # Sub-pixel changes (e.g. re-applying a stored position)
+                # are not worth notifying listeners about
+                if (abs(rel_x - self._relative_x) < 1e-4
+                        and abs(rel_y - self._relative_y) < 1e-4):
+                    return super().itemChange(change, value)
+                
+                self._relative_x = rel_x
+                self._relative_y = rel_y
                 
-                self.position_changed.emit(
-                    self._name, self._relative_x, self._relative_y
-                )
+                if not self._emit_timer.isActive():
+                    self._emit_timer.start()
         
         return super().itemChange(change, value)
     
+    def _flush_position(self):
+        """Emit the latest relative position."""
+        self._emit_timer.stop()
+        self.position_changed.emit(
+            self._name, self._relative_x, self._relative_y
+        )
+    
+    def mouseReleaseEvent(self, event):
+        """Emit any pending position immediately when a drag ends."""
+        super().mouseReleaseEvent(event)
+        if self._emit_timer.isActive():
+            self._flush_position()
+    
     def hoverEnterEvent(self, event):
         """Handle hover enter."""
         self._is_hovered = True
@@ -120,6 +219,11 @@ class DraggableItem(QGraphicsObject):
         super().hoverLeaveEvent(event)
 
 
+# Dashed frame drawn around selected or hovered items
+SELECTION_PEN = QPen(QColor(0, 113, 227), 2, Qt.PenStyle.DashLine)
+
+# Shared color instances; setters fall back to these entries rather than
+# constructing a new QColor per call, so they must not be mutated
 COLOR_MAP = {
     'white': QColor(255, 255, 255),
     'black': QColor(0, 0, 0),
@@ -146,67 +250,87 @@ class DraggableTextLabel(DraggableItem):
         """
         super().__init__(name, parent)
         
-        self._text = text
-        self._font = QFont("Arial")
-        self._font.setPixelSize(16)  # Use pixel size for DPI independence
-        self._font_bold = False
-        self._text_color = QColor(255, 255, 255)
-        self._padding = 6
-        
-        self._width = 100
-        self._height = 30
+        self._text: str = text
+        self._font = _get_font("Arial", 16)
+        self._fm = _get_font_metrics(self._font)
+        self._font_bold: bool = False
+        self._text_color = COLOR_MAP['white']
+        self._padding: int = 6
+        self._static_text = _make_static_text(self._text, self._font)
+        self._text_origin = QPointF()
+        
+        self._width: int = 100
+        self._height: int = 30
         self._update_size()
+        
+        # Content only changes through setters, which call update()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
     
     def set_text(self, text: str):
         """Set display text."""
+        if text == self._text:
+            return
         self._text = text
+        self._static_text = _make_static_text(text, self._font)
         self._update_size()
         self.update()
     
     def set_font(self, family: str, size: int, bold: bool = False):
         """Set text font using pixel size for DPI independence."""
-        self._font = QFont(family)
-        self._font.setPixelSize(size)  # Use pixel size instead of point size
+        font = _get_font(family, size, bold)
+        if font is self._font:
+            return
+        self._font = font
         self._font_bold = bold
-        self._font.setBold(bold)
+        self._fm = _get_font_metrics(self._font)
+        self._static_text = _make_static_text(self._text, font)
         self._update_size()
         self.update()
     
     def set_color(self, color: str):
         """Set text color by name."""
-        self._text_color = COLOR_MAP.get(color, QColor(255, 255, 255))
+        qcolor = COLOR_MAP.get(color, COLOR_MAP['white'])
+        if qcolor is self._text_color:
+            return
+        self._text_color = qcolor
+        self.update()
     
     def _update_size(self):
         """Update bounding rect based on text size."""
-        from PyQt6.QtGui import QFontMetrics
-        fm = QFontMetrics(self._font)
-        text_rect = fm.boundingRect(self._text)
-        self._width = text_rect.width() + self._padding * 2
-        self._height = text_rect.height() + self._padding * 2
+        if self._defer_geometry():
+            return
+        
+        # Single-line text: advance and line height are enough, and much
+        # cheaper than the glyph-exact boundingRect()
+        text_width = self._fm.horizontalAdvance(self._text)
+        text_height = self._fm.height()
+        self._width = text_width + self._padding * 2
+        self._height = text_height + self._padding * 2
+        self._text_origin = QPointF(self._padding, self._padding)
         self.prepareGeometryChange()
+        self._bounding_rect = QRectF(0, 0, self._width, self._height)
     
     def boundingRect(self) -> QRectF:
         """Return bounding rectangle."""
-        return QRectF(0, 0, self._width, self._height)
+        return self._bounding_rect
     
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
         """Paint the text label."""
+        if option.exposedRect.isEmpty():
+            return
+        
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw selection/hover indicator
         if self.isSelected() or self._is_hovered:
-            painter.setPen(QPen(QColor(0, 113, 227), 2, Qt.PenStyle.DashLine))
+            painter.setPen(SELECTION_PEN)
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRoundedRect(self.boundingRect(), 4, 4)
+            painter.drawRoundedRect(self._bounding_rect, 4, 4)
         
         # Draw text directly (no background, no outline)
         painter.setFont(self._font)
         painter.setPen(self._text_color)
-        painter.drawText(
-            self.boundingRect(),
-            Qt.AlignmentFlag.AlignCenter,
-            self._text
-        )
+        painter.drawStaticText(self._text_origin, self._static_text)
 
 
 class DraggableScaleBar(DraggableItem):
@@ -218,84 +342,113 @@ class DraggableScaleBar(DraggableItem):
         """Initialize scale bar."""
         super().__init__(name, parent)
         
-        self._bar_length = 100
-        self._bar_thickness = 3
-        self._bar_color = QColor(255, 255, 255)
-        self._text = "50 μm"
-        self._text_enabled = True
-        self._text_position = "below"
-        self._text_gap = 5
-        self._font = QFont("Arial")
-        self._font.setPixelSize(14)  # Use pixel size for DPI independence
-        self._font_bold = False
-        self._text_color = QColor(255, 255, 255)
+        self._bar_length: int = 100
+        self._bar_thickness: int = 3
+        self._bar_color = COLOR_MAP['white']
+        self._bar_brush = QBrush(self._bar_color)
+        self._text: str = "50 μm"
+        self._text_enabled: bool = True
+        self._text_position: str = "below"
+        self._text_gap: int = 5
+        self._font = _get_font("Arial", 14)
+        self._fm = _get_font_metrics(self._font)
+        self._font_bold: bool = False
+        self._text_color = COLOR_MAP['white']
+        self._static_text = _make_static_text(self._text, self._font)
         
         self._update_size()  # Dynamically calculate width and height
+        
+        # Content only changes through setters, which call update()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
     
     def set_bar_length(self, length: int):
         """Set bar length in pixels."""
+        if length == self._bar_length:
+            return
         self._bar_length = length
         self._update_size()
         self.update()
     
     def set_bar_thickness(self, thickness: int):
         """Set bar thickness."""
+        if thickness == self._bar_thickness:
+            return
         self._bar_thickness = thickness
         self._update_size()
         self.update()
     
     def set_bar_color(self, color: str):
         """Set bar color by name."""
-        self._bar_color = COLOR_MAP.get(color, QColor(255, 255, 255))
+        qcolor = COLOR_MAP.get(color, COLOR_MAP['white'])
+        if qcolor is self._bar_color:
+            return
+        self._bar_color = qcolor
+        self._bar_brush = QBrush(qcolor)
         self.update()
     
     def set_text(self, text: str):
         """Set scale text."""
+        if text == self._text:
+            return
         self._text = text
+        self._static_text = _make_static_text(text, self._font)
         self._update_size()
         self.update()
     
     def set_text_enabled(self, enabled: bool):
         """Enable or disable text."""
+        if enabled == self._text_enabled:
+            return
         self._text_enabled = enabled
         self._update_size()
         self.update()
     
     def set_text_position(self, position: str):
         """Set text position ('above' or 'below')."""
+        if position == self._text_position:
+            return
         self._text_position = position
         self._update_size()
         self.update()
     
     def set_text_gap(self, gap: int):
         """Set gap between bar and text in pixels."""
+        if gap == self._text_gap:
+            return
         self._text_gap = gap
         self._update_size()
         self.update()
     
     def set_font(self, family: str, size: int, bold: bool = False):
         """Set text font using pixel size for DPI independence."""
-        self._font = QFont(family)
-        self._font.setPixelSize(size)  # Use pixel size instead of point size
+        font = _get_font(family, size, bold)
+        if font is self._font:
+            return
+        self._font = font
         self._font_bold = bold
-        self._font.setBold(bold)
+        self._fm = _get_font_metrics(self._font)
+        self._static_text = _make_static_text(self._text, font)
         self._update_size()
         self.update()
     
     def set_text_color(self, color: str):
         """Set text color by name."""
-        self._text_color = COLOR_MAP.get(color, QColor(255, 255, 255))
+        qcolor = COLOR_MAP.get(color, COLOR_MAP['white'])
+        if qcolor is self._text_color:
+            return
+        self._text_color = qcolor
         self.update()
     
     def _update_size(self):
         """Update bounding rect based on bar and text dimensions."""
-        from PyQt6.QtGui import QFontMetrics
+        if self._defer_geometry():
+            return
         
         # Calculate width: max of bar length and text width
         bar_with_margin = self._bar_length + 20  # 10px left + 10px right
         
         if self._text_enabled:
-            fm = QFontMetrics(self._font)
+            fm = self._fm
             text_width = fm.horizontalAdvance(self._text)
             text_with_margin = text_width + 20  # 10px left + 10px right
             self._width = max(bar_with_margin, text_with_margin)
@@ -318,18 +471,22 @@ class DraggableScaleBar(DraggableItem):
             self._height = 8 + self._bar_thickness + 8
         
         self.prepareGeometryChange()
+        self._bounding_rect = QRectF(0, 0, self._width, self._height)
     
     def boundingRect(self) -> QRectF:
         """Return bounding rectangle."""
-        return QRectF(0, 0, self._width, self._height)
+        return self._bounding_rect
     
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
         """Paint the scale bar."""
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)  # Disable for sharp edges
+        exposed = option.exposedRect
+        if exposed.isEmpty():
+            return
+        
+        # Bar and frame are integer, axis-aligned rects; only text needs AA
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         
-        from PyQt6.QtGui import QFontMetrics
-        fm = QFontMetrics(self._font)
-        text_height = fm.height()
+        fm = self._fm
         ascent = fm.ascent()
         
         bar_x = 10
@@ -348,12 +505,13 @@ class DraggableScaleBar(DraggableItem):
         
         # Draw scale bar as filled rectangle (square ends, not rounded)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(self._bar_color))
+        painter.setBrush(self._bar_brush)
         bar_top = int(bar_y - half_thickness)
         bar_rect_height = self._bar_thickness
         painter.drawRect(bar_x, bar_top, self._bar_length, bar_rect_height)
         
-        if self._text_enabled:
+        text_band = QRectF(0, text_baseline_y - ascent, self._width, fm.height())
+        if self._text_enabled and exposed.intersects(text_band):
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)  # Re-enable for text
             painter.setFont(self._font)
             
@@ -361,13 +519,17 @@ class DraggableScaleBar(DraggableItem):
             text_x = bar_x + (self._bar_length - text_width) // 2
             
             painter.setPen(self._text_color)
-            painter.drawText(text_x, int(text_baseline_y), self._text)
+            painter.drawStaticText(text_x, int(text_baseline_y) - ascent, self._static_text)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         
         if self.isSelected() or self._is_hovered:
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-            painter.setPen(QPen(QColor(0, 113, 227), 2, Qt.PenStyle.DashLine))
+            painter.setPen(SELECTION_PEN)
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(self.boundingRect())
+            painter.drawRect(self._bounding_rect.toRect())
+
+
+# Tick labels keep two decimals to match the colorbar drawn by FrameRenderer
+_format_tick_label = "{:.2f}".format
 
 
 class DraggableColorbar(DraggableItem):
@@ -379,42 +541,55 @@ class DraggableColorbar(DraggableItem):
         """Initialize colorbar."""
         super().__init__(name, parent)
         
-        self._colormap_image = None
-        self._title = "Speed (μm/s)"
-        self._vmin = 0.0
-        self._vmax = 100.0
-        self._tick_interval = 20.0
-        
-        self._bar_width = 14
-        self._bar_height = 200
-        self._title_position = "top"
-        self._title_gap = 5
-        self._title_font = QFont("Arial")
-        self._title_font.setPixelSize(12)  # Use pixel size for DPI independence
-        self._title_bold = False
-        self._title_color = QColor(0, 0, 0)
-        self._tick_font = QFont("Arial")
-        self._tick_font.setPixelSize(10)  # Use pixel size for DPI independence
-        self._tick_bold = False
-        self._tick_color = QColor(0, 0, 0)
-        self._border_thickness = 1
-        self._tick_thickness = 1
-        self._tick_length = 5
-        
-        self._update_total_size()
-        
-        # Set cache mode to prevent drag trails
-        self.setCacheMode(QGraphicsItem.CacheMode.NoCache)
-    
-    def _update_total_size(self):
+        self._colormap_array = None
+        self._colormap_image: QPixmap | None = None
+        self._scaled_pixmap: QPixmap | None = None
+        self._title: str = "Speed (μm/s)"
+        self._vmin: float = 0.0
+        self._vmax: float = 100.0
+        self._tick_interval: float = 20.0
+        
+        self._bar_width: int = 14
+        self._bar_height: int = 200
+        self._title_position: str = "top"
+        self._title_gap: int = 5
+        self._title_font = _get_font("Arial", 12)
+        self._title_bold: bool = False
+        self._title_static = _make_static_text(self._title, self._title_font)
+        self._title_color = COLOR_MAP['black']
+        self._tick_font = _get_font("Arial", 10)
+        self._title_fm = _get_font_metrics(self._title_font)
+        self._tick_fm = _get_font_metrics(self._tick_font)
+        self._tick_bold: bool = False
+        self._tick_color = COLOR_MAP['black']
+        self._border_thickness: int = 1
+        self._tick_thickness: int = 1
+        self._tick_length: int = 5
+        self._update_pens()
+        
+        # (fraction from top of bar, label) per tick, rebuilt on range change
+        self._tick_cache: list[tuple[float, QStaticText]] = []
+        self._tick_lines: list[QLineF] = []
+        self._max_tick_width = 0
+        
+        self._update_ticks()
+        self._update_size()
+        
+        # Drag trails are avoided by calling prepareGeometryChange() before
+        # the bounding rect changes, so the rendered item can be cached
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+    
+    def _update_size(self):
         """Recalculate total bounding rect size."""
-        from PyQt6.QtGui import QFontMetrics
+        if self._defer_geometry():
+            return
         
-        title_fm = QFontMetrics(self._title_font)
-        tick_fm = QFontMetrics(self._tick_font)
+        title_fm = self._title_fm
+        tick_fm = self._tick_fm
         
         # Calculate tick label width (estimate with max value)
-        max_tick_width = tick_fm.horizontalAdvance(f"{self._vmax:.2f}")
+        max_tick_width = tick_fm.horizontalAdvance(_format_tick_label(self._vmax))
+        self._max_tick_width = max_tick_width
         
         # Calculate dimensions based on title position
         if self._title_position == "top":
@@ -443,98 +618,182 @@ class DraggableColorbar(DraggableItem):
             self._total_width = self._bar_width + self._tick_length + 3 + max_tick_width + self._title_gap + title_fm.height() + 20
             self._total_height = max(self._bar_height, title_height) + 20
         
+        # Tick marks in bar-local coordinates, drawn in a single call
+        tick_x1 = self._bar_width + self._tick_length
+        self._tick_lines = [
+            QLineF(self._bar_width, int(fraction * self._bar_height),
+                   tick_x1, int(fraction * self._bar_height))
+            for fraction, _ in self._tick_cache
+        ]
+        
         self.prepareGeometryChange()
+        self._bounding_rect = QRectF(0, 0, self._total_width, self._total_height)
     
     def set_colormap_image(self, image):
         """Set colormap image (numpy array BGR)."""
-        if image is not None:
-            from ..utils import numpy_to_qpixmap
-            self._colormap_image = numpy_to_qpixmap(image)
-        self._update_total_size()
+        # The gradient is regenerated on every preview refresh, so compare
+        # contents to avoid converting and rescaling an identical image
+        if image is None or (
+            self._colormap_array is not None
+            and np.array_equal(image, self._colormap_array)
+        ):
+            return
+        self._colormap_array = image
+        self._colormap_image = numpy_to_qpixmap(image)
+        self._rescale_pixmap()
         self.update()
     
     def set_bar_size(self, width: int, height: int):
         """Set bar dimensions."""
+        if width == self._bar_width and height == self._bar_height:
+            return
         self._bar_width = width
         self._bar_height = height
-        self._update_total_size()
+        self._rescale_pixmap()
+        self._update_size()
         self.update()
     
+    def _rescale_pixmap(self):
+        """Scale the colormap image to the current bar size."""
+        if self._colormap_image is None:
+            self._scaled_pixmap = None
+            return
+        
+        self._scaled_pixmap = self._colormap_image.scaled(
+            self._bar_width, self._bar_height,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    
     def set_title(self, title: str):
         """Set colorbar title."""
+        if title == self._title:
+            return
         self._title = title
-        self._update_total_size()
+        self._title_static = _make_static_text(title, self._title_font)
+        self._update_size()
         self.update()
     
     def set_title_position(self, position: str):
         """Set title position ('top' or 'right')."""
-        self._title_position = position.lower()
-        self._update_total_size()
+        position = position.lower()
+        if position == self._title_position:
+            return
+        self._title_position = position
+        self._update_size()
         self.update()
     
     def set_title_gap(self, gap: int):
         """Set gap between title and colorbar."""
+        if gap == self._title_gap:
+            return
         self._title_gap = gap
-        self._update_total_size()
+        self._update_size()
         self.update()
     
     def set_range(self, vmin: float, vmax: float, tick_interval: float):
         """Set value range and tick interval."""
+        if (vmin, vmax, tick_interval) == (self._vmin, self._vmax, self._tick_interval):
+            return
         self._vmin = vmin
         self._vmax = vmax
         self._tick_interval = tick_interval
-        self._update_total_size()
+        self._update_ticks()
+        self._update_size()
         self.update()
     
+    def _update_ticks(self):
+        """Precompute tick positions and labels for the current range."""
+        self._tick_cache = []
+        if self._vmax <= self._vmin or self._tick_interval <= 0:
+            return
+        
+        value_range = self._vmax - self._vmin
+        num_ticks = int(value_range / self._tick_interval) + 1
+        format_label = _format_tick_label
+        for i in range(num_ticks):
+            value = self._vmax - i * self._tick_interval
+            if value < self._vmin:
+                break
+            self._tick_cache.append((
+                (self._vmax - value) / value_range,
+                _make_static_text(format_label(value), self._tick_font)
+            ))
+    
     def set_fonts(
         self, title_family: str, title_size: int, title_bold: bool,
         tick_family: str, tick_size: int, tick_bold: bool
     ):
         """Set fonts for title and tick labels using pixel size."""
-        self._title_font = QFont(title_family)
-        self._title_font.setPixelSize(title_size)  # Use pixel size
+        title_font = _get_font(title_family, title_size, title_bold)
+        tick_font = _get_font(tick_family, tick_size, tick_bold)
+        if title_font is self._title_font and tick_font is self._tick_font:
+            return
+        self._title_font = title_font
         self._title_bold = title_bold
-        self._title_font.setBold(title_bold)
-        self._tick_font = QFont(tick_family)
-        self._tick_font.setPixelSize(tick_size)  # Use pixel size
+        self._tick_font = tick_font
         self._tick_bold = tick_bold
-        self._tick_font.setBold(tick_bold)
-        self._update_total_size()
+        self._title_fm = _get_font_metrics(self._title_font)
+        self._tick_fm = _get_font_metrics(self._tick_font)
+        self._title_static = _make_static_text(self._title, title_font)
+        self._update_ticks()
+        self._update_size()
         self.update()
     
     def set_title_color(self, color: str):
         """Set title color by name."""
-        self._title_color = COLOR_MAP.get(color, QColor(0, 0, 0))
+        qcolor = COLOR_MAP.get(color, COLOR_MAP['black'])
+        if qcolor is self._title_color:
+            return
+        self._title_color = qcolor
         self.update()
     
     def set_tick_color(self, color: str):
         """Set tick label color by name."""
-        self._tick_color = COLOR_MAP.get(color, QColor(0, 0, 0))
+        qcolor = COLOR_MAP.get(color, COLOR_MAP['black'])
+        if qcolor is self._tick_color:
+            return
+        self._tick_color = qcolor
+        self._update_pens()
         self.update()
     
     def set_border_thickness(self, thickness: int):
         """Set border line thickness."""
+        if thickness == self._border_thickness:
+            return
         self._border_thickness = thickness
+        self._update_pens()
         self.update()
     
     def set_tick_style(self, thickness: int, length: int):
         """Set tick mark thickness and length."""
+        if thickness == self._tick_thickness and length == self._tick_length:
+            return
         self._tick_thickness = thickness
         self._tick_length = length
-        self._update_total_size()
+        self._update_pens()
+        self._update_size()
         self.update()
     
+    def _update_pens(self):
+        """Rebuild border and tick pens from the current color and thicknesses."""
+        self._border_pen = QPen(self._tick_color, self._border_thickness)
+        self._tick_pen = QPen(self._tick_color, self._tick_thickness)
+    
     def boundingRect(self) -> QRectF:
         """Return bounding rectangle."""
-        return QRectF(0, 0, self._total_width, self._total_height)
+        return self._bounding_rect
     
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
         """Paint the colorbar."""
+        exposed = option.exposedRect
+        if exposed.isEmpty():
+            return
+        
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        from PyQt6.QtGui import QFontMetrics
-        title_fm = QFontMetrics(self._title_font)
-        tick_fm = QFontMetrics(self._tick_font)
+        title_fm = self._title_fm
+        tick_fm = self._tick_fm
         
         # Calculate bar_x with potential left padding for wide titles
         bar_x_base = 5
@@ -559,57 +818,59 @@ class DraggableColorbar(DraggableItem):
             # Center title horizontally over the bar
             title_width = title_fm.horizontalAdvance(self._title)
             title_x = bar_x + (self._bar_width - title_width) // 2
-            painter.drawText(title_x, int(title_y), self._title)
+            painter.drawStaticText(
+                title_x, int(title_y) - title_fm.ascent(), self._title_static
+            )
         else:
             # Title on right, vertical
             bar_y = 5
         
         # Draw colormap image
-        if self._colormap_image:
-            scaled_pixmap = self._colormap_image.scaled(
-                self._bar_width, self._bar_height,
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            painter.drawPixmap(bar_x, int(bar_y), scaled_pixmap)
+        bar_rect = QRectF(bar_x, bar_y, self._bar_width, self._bar_height)
+        if self._scaled_pixmap is not None and exposed.intersects(bar_rect):
+            painter.drawPixmap(bar_x, int(bar_y), self._scaled_pixmap)
         
         # Draw bar border
-        painter.setPen(QPen(self._tick_color, self._border_thickness))
+        painter.setPen(self._border_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRect(bar_x, int(bar_y), self._bar_width, self._bar_height)
         
         # Draw tick marks and labels
         painter.setFont(self._tick_font)
-        painter.setPen(QPen(self._tick_color, self._tick_thickness))
-        if self._vmax > self._vmin and self._tick_interval > 0:
-            num_ticks = int((self._vmax - self._vmin) / self._tick_interval) + 1
+        painter.setPen(self._tick_pen)
+        if self._tick_lines:
+            painter.save()
+            painter.translate(bar_x, bar_y)
+            painter.drawLines(self._tick_lines)
+            painter.restore()
+        
+        # Tick labels extend about half a line above and below the tick
+        label_margin = tick_fm.height()
+        exposed_top = exposed.top() - label_margin
+        exposed_bottom = exposed.bottom() + label_margin
+        
+        # Ticks are cached top to bottom, so stop at the first one below
+        # the exposed area
+        for fraction, label in self._tick_cache:
+            tick_y = bar_y + int(fraction * self._bar_height)
+            if tick_y < exposed_top:
+                continue
+            if tick_y > exposed_bottom:
+                break
             
-            for i in range(num_ticks):
-                value = self._vmax - i * self._tick_interval
-                if value < self._vmin:
-                    break
-                
-                tick_y = bar_y + int(
-                    (self._vmax - value) / (self._vmax - self._vmin) * self._bar_height
-                )
-                
-                painter.drawLine(
-                    bar_x + self._bar_width, int(tick_y),
-                    bar_x + self._bar_width + self._tick_length, int(tick_y)
-                )
-                
-                painter.drawText(
-                    bar_x + self._bar_width + self._tick_length + 3, int(tick_y) + tick_fm.ascent() // 2,
-                    f"{value:.2f}"
-                )
+            # Static text is positioned by its top-left rather than baseline
+            painter.drawStaticText(
+                bar_x + self._bar_width + self._tick_length + 3,
+                int(tick_y) + tick_fm.ascent() // 2 - tick_fm.ascent(),
+                label
+            )
         
         # Draw title on right side (vertical text)
         if self._title_position == "right":
             painter.setFont(self._title_font)
             painter.setPen(self._title_color)
             
-            max_tick_width = tick_fm.horizontalAdvance(f"{self._vmax:.2f}")
-            title_x = bar_x + self._bar_width + 8 + max_tick_width + self._title_gap
+            title_x = bar_x + self._bar_width + 8 + self._max_tick_width + self._title_gap
             
             # Draw vertical text (rotated 90 degrees, facing left = -90)
             painter.save()
@@ -618,11 +879,14 @@ class DraggableColorbar(DraggableItem):
             painter.rotate(-90)
             
             title_width = title_fm.horizontalAdvance(self._title)
-            painter.drawText(-title_width // 2, title_fm.ascent() // 2, self._title)
+            painter.drawStaticText(
+                -title_width // 2, title_fm.ascent() // 2 - title_fm.ascent(),
+                self._title_static
+            )
             painter.restore()
         
         # Draw selection/hover indicator
         if self.isSelected() or self._is_hovered:
-            painter.setPen(QPen(QColor(0, 113, 227), 2, Qt.PenStyle.DashLine))
+            painter.setPen(SELECTION_PEN)
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(self.boundingRect())
+            painter.drawRect(self._bounding_rect)
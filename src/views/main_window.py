@@ -9,11 +9,12 @@ import os
 import webbrowser
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, pyqtSignal, QUrl
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSettings, QTimer, QUrl
 from PyQt6.QtGui import QAction, QKeySequence, QDesktopServices
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
-    QMenuBar, QMenu, QStatusBar, QMessageBox, QPushButton, QFrame
+    QMenuBar, QMenu, QStatusBar, QMessageBox, QPushButton,
+    QButtonGroup
 )
 
 from .parameter_panel import ParameterPanel
@@ -22,6 +23,20 @@ from .styles import get_application_style
 from ..utils import get_app_icon
 
 
+ABOUT_HTML = (
+    "<h3>Bac-Motion Visualization</h3>"
+    "<p>Version 1.0.0</p>"
+    "<p>A professional bacterial motion visualization application.</p>"
+    "<p>Overlays segmentation and tracking masks onto original "
+    "image sequences for intuitive visualization.</p>"
+    "<hr>"
+    "<p>Author: Lucien (lucien-6@qq.com)</p>"
+    "<p>License: MIT License</p>"
+)
+
+HELP_GUIDE_PATH = Path(__file__).parent.parent.parent / "resources" / "help_guide.html"
+
+
 class MainWindow(QMainWindow):
     """
     Main application window.
@@ -32,6 +47,7 @@ class MainWindow(QMainWindow):
         load_config_requested: Request to load configuration.
         export_requested: Request to export visualization.
         preview_mode_changed(str): Preview mode changed ('edit' or 'final').
+            Rapid toggles are coalesced into a single emission.
     """
     
     load_data_requested = pyqtSignal()
@@ -40,16 +56,33 @@ class MainWindow(QMainWindow):
     export_requested = pyqtSignal()
     preview_mode_changed = pyqtSignal(str)
     
+    # Preview mode for each mode button id
+    PREVIEW_MODES = ('edit', 'final')
+    
+    MODE_EMIT_DELAY_MS = 50
+    
+    SPLITTER_STATE_KEY = "main_window/splitter_state"
+    
+    _help_url: QUrl | None = None
+    
     def __init__(self):
         """Initialize main window."""
         super().__init__()
         
+        # Message boxes are created on first use and reused afterwards
+        self._message_boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+        
+        # Build the whole widget tree before allowing any repaint
+        self.setUpdatesEnabled(False)
+        
         self._setup_window()
         self._setup_ui()
         self._setup_menu()
         self._setup_status_bar()
         
         self.setStyleSheet(get_application_style())
+        
+        self.setUpdatesEnabled(True)
     
     def _setup_window(self):
         """Configure window properties."""
@@ -80,28 +113,12 @@ class MainWindow(QMainWindow):
         preview_layout.setSpacing(0)
         
         # Preview toolbar
-        self._preview_toolbar = QFrame()
-        self._preview_toolbar.setStyleSheet("""
-            QFrame {
-                background-color: #f0f0f0;
-                border-bottom: 1px solid #d0d0d0;
-            }
-            QPushButton {
-                padding: 6px 12px;
-                border: 1px solid #c0c0c0;
-                border-radius: 4px;
-                background-color: #ffffff;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-            }
-            QPushButton:checked {
-                background-color: #0078d4;
-                color: white;
-                border-color: #0078d4;
-            }
-        """)
+        self._preview_toolbar = QWidget()
+        self._preview_toolbar.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        # The stylesheet fills the whole toolbar with an opaque color, so Qt
+        # does not need to clear the background first
+        self._preview_toolbar.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._preview_toolbar.setObjectName("previewToolbar")
         toolbar_layout = QHBoxLayout(self._preview_toolbar)
         toolbar_layout.setContentsMargins(8, 4, 8, 4)
         toolbar_layout.setSpacing(8)
@@ -111,16 +128,28 @@ class MainWindow(QMainWindow):
         self._edit_mode_btn.setCheckable(True)
         self._edit_mode_btn.setChecked(True)
         self._edit_mode_btn.setToolTip("Edit Mode: Drag labels to adjust positions")
-        self._edit_mode_btn.clicked.connect(self._on_edit_mode_clicked)
         toolbar_layout.addWidget(self._edit_mode_btn)
         
         self._final_mode_btn = QPushButton("Final Preview")
         self._final_mode_btn.setCheckable(True)
         self._final_mode_btn.setChecked(False)
         self._final_mode_btn.setToolTip("Final Preview: Show exact export result")
-        self._final_mode_btn.clicked.connect(self._on_final_mode_clicked)
         toolbar_layout.addWidget(self._final_mode_btn)
         
+        # Exclusive group keeps exactly one mode button checked
+        self._mode_group = QButtonGroup(self)
+        self._mode_group.setExclusive(True)
+        self._mode_group.addButton(self._edit_mode_btn, 0)
+        self._mode_group.addButton(self._final_mode_btn, 1)
+        self._mode_group.idClicked.connect(self._on_mode_clicked)
+        
+        # Switching modes re-renders the preview, so collapse bursts of clicks
+        self._pending_mode = self.PREVIEW_MODES[0]
+        self._mode_emit_timer = QTimer(self)
+        self._mode_emit_timer.setSingleShot(True)
+        self._mode_emit_timer.setInterval(self.MODE_EMIT_DELAY_MS)
+        self._mode_emit_timer.timeout.connect(self._flush_preview_mode)
+        
         toolbar_layout.addStretch()
         
         preview_layout.addWidget(self._preview_toolbar)
@@ -133,7 +162,10 @@ class MainWindow(QMainWindow):
         self._splitter.setStretchFactor(0, 0)
         self._splitter.setStretchFactor(1, 1)
         
-        self._splitter.setSizes([380, 1020])
+        # Restore the last session's panel sizes in one step if available
+        state = QSettings().value(self.SPLITTER_STATE_KEY)
+        if not state or not self._splitter.restoreState(state):
+            self._splitter.setSizes([380, 1020])
         
         layout.addWidget(self._splitter)
     
@@ -145,14 +177,14 @@ class MainWindow(QMainWindow):
         
         load_data_action = QAction("Load Data...", self)
         load_data_action.setShortcut(QKeySequence("Ctrl+L"))
-        load_data_action.triggered.connect(self.load_data_requested.emit)
+        load_data_action.triggered.connect(self.load_data_requested)
         file_menu.addAction(load_data_action)
         
         file_menu.addSeparator()
         
         export_action = QAction("Export...", self)
         export_action.setShortcut(QKeySequence("Ctrl+E"))
-        export_action.triggered.connect(self.export_requested.emit)
+        export_action.triggered.connect(self.export_requested)
         file_menu.addAction(export_action)
         
         file_menu.addSeparator()
@@ -166,12 +198,12 @@ class MainWindow(QMainWindow):
         
         save_config_action = QAction("Save Config...", self)
         save_config_action.setShortcut(QKeySequence("Ctrl+S"))
-        save_config_action.triggered.connect(self.save_config_requested.emit)
+        save_config_action.triggered.connect(self.save_config_requested)
         config_menu.addAction(save_config_action)
         
         load_config_action = QAction("Load Config...", self)
         load_config_action.setShortcut(QKeySequence("Ctrl+I"))
-        load_config_action.triggered.connect(self.load_config_requested.emit)
+        load_config_action.triggered.connect(self.load_config_requested)
         config_menu.addAction(load_config_action)
         
         help_menu = menubar.addMenu("Help")
@@ -194,36 +226,31 @@ class MainWindow(QMainWindow):
         
         self._status_bar.showMessage("Ready")
     
+    @pyqtSlot()
     def _show_user_guide(self):
         """Open the user guide in the default browser."""
-        # Get the help guide path relative to this file
-        help_path = Path(__file__).parent.parent.parent / "resources" / "help_guide.html"
+        # Resolve the guide once; a missing guide is re-checked on each press
+        if MainWindow._help_url is None and HELP_GUIDE_PATH.exists():
+            MainWindow._help_url = QUrl.fromLocalFile(str(HELP_GUIDE_PATH.resolve()))
         
-        if help_path.exists():
+        if MainWindow._help_url is not None:
             # Open in default browser
-            url = QUrl.fromLocalFile(str(help_path.resolve()))
-            QDesktopServices.openUrl(url)
+            QDesktopServices.openUrl(MainWindow._help_url)
         else:
-            QMessageBox.warning(
-                self,
+            self.show_warning(
                 "Help Not Found",
-                f"User guide file not found:\n{help_path}"
+                f"User guide file not found:\n{HELP_GUIDE_PATH}"
             )
     
+    @pyqtSlot()
     def _show_about(self):
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About Bac-Motion Visualization",
-            "<h3>Bac-Motion Visualization</h3>"
-            "<p>Version 1.0.0</p>"
-            "<p>A professional bacterial motion visualization application.</p>"
-            "<p>Overlays segmentation and tracking masks onto original "
-            "image sequences for intuitive visualization.</p>"
-            "<hr>"
-            "<p>Author: Lucien (lucien-6@qq.com)</p>"
-            "<p>License: MIT License</p>"
-        )
+        QMessageBox.about(self, "About Bac-Motion Visualization", ABOUT_HTML)
+    
+    def closeEvent(self, event):
+        """Persist the splitter layout when the window closes."""
+        QSettings().setValue(self.SPLITTER_STATE_KEY, self._splitter.saveState())
+        super().closeEvent(event)
     
     @property
     def parameter_panel(self) -> ParameterPanel:
@@ -245,26 +272,41 @@ class MainWindow(QMainWindow):
         """
         self._status_bar.showMessage(message, timeout)
     
+    def _show_message(self, icon: QMessageBox.Icon, title: str, message: str):
+        """Show a modal message box, reusing one instance per icon."""
+        box = self._message_boxes.get(icon)
+        if box is None or box.isVisible():
+            box = QMessageBox(icon, "", "", QMessageBox.StandardButton.Ok, self)
+            box.setTextFormat(Qt.TextFormat.PlainText)
+            if icon in self._message_boxes:
+                # A message of this kind is already open; use a temporary box
+                box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            else:
+                self._message_boxes[icon] = box
+        
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.exec()
+    
     def show_error(self, title: str, message: str):
         """Show error message box."""
-        QMessageBox.critical(self, title, message)
+        self._show_message(QMessageBox.Icon.Critical, title, message)
     
     def show_warning(self, title: str, message: str):
         """Show warning message box."""
-        QMessageBox.warning(self, title, message)
+        self._show_message(QMessageBox.Icon.Warning, title, message)
     
     def show_info(self, title: str, message: str):
         """Show information message box."""
-        QMessageBox.information(self, title, message)
+        self._show_message(QMessageBox.Icon.Information, title, message)
     
-    def _on_edit_mode_clicked(self):
-        """Handle Edit Mode button click."""
-        self._edit_mode_btn.setChecked(True)
-        self._final_mode_btn.setChecked(False)
-        self.preview_mode_changed.emit('edit')
+    @pyqtSlot(int)
+    def _on_mode_clicked(self, button_id: int):
+        """Handle preview mode button click."""
+        self._pending_mode = self.PREVIEW_MODES[button_id]
+        self._mode_emit_timer.start()
     
-    def _on_final_mode_clicked(self):
-        """Handle Final Preview button click."""
-        self._edit_mode_btn.setChecked(False)
-        self._final_mode_btn.setChecked(True)
-        self.preview_mode_changed.emit('final')
\ No newline at end of file
+    @pyqtSlot()
+    def _flush_preview_mode(self):
+        """Emit the most recently selected preview mode."""
+        self.preview_mode_changed.emit(self._pending_mode)
\ No newline at end of file
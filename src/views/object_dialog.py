@@ -4,11 +4,10 @@ Object operation dialog.
 Dialog for hiding/truncating object visualization at specific frames.
 """
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QRadioButton, QButtonGroup, QPushButton,
-    QFrame
+    QRadioButton, QButtonGroup, QPushButton, QWidget
 )
 
 from ..utils import get_app_icon
@@ -55,29 +54,19 @@ class ObjectDialog(QDialog):
         layout.setSpacing(16)
         layout.setContentsMargins(24, 24, 24, 24)
         
-        info_frame = QFrame()
-        info_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f0f0f5;
-                border-radius: 8px;
-                padding: 12px;
-            }
-        """)
+        info_frame = QWidget()
+        info_frame.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        info_frame.setObjectName("objectInfoFrame")
         info_layout = QVBoxLayout(info_frame)
         info_layout.setSpacing(8)
         
-        obj_label = QLabel(f"Object ID: <b>{self._obj_id}</b>")
-        obj_label.setStyleSheet("font-size: 14px;")
-        info_layout.addWidget(obj_label)
-        
-        frame_label = QLabel(f"Current Frame: <b>{self._current_frame}</b>")
-        frame_label.setStyleSheet("font-size: 14px;")
-        info_layout.addWidget(frame_label)
+        self._add_info_row(info_layout, "Object ID:", str(self._obj_id))
+        self._add_info_row(info_layout, "Current Frame:", str(self._current_frame))
         
         layout.addWidget(info_frame)
         
         option_label = QLabel("Select operation:")
-        option_label.setStyleSheet("font-size: 14px; font-weight: 600;")
+        option_label.setObjectName("objectOptionLabel")
         layout.addWidget(option_label)
         
         self._button_group = QButtonGroup(self)
@@ -85,14 +74,14 @@ class ObjectDialog(QDialog):
         self._before_radio = QRadioButton(
             f"Hide at frame ≤ {self._current_frame} (before and including current)"
         )
-        self._before_radio.setStyleSheet("font-size: 13px;")
+        self._before_radio.setObjectName("objectOptionRadio")
         self._button_group.addButton(self._before_radio, 1)
         layout.addWidget(self._before_radio)
         
         self._after_radio = QRadioButton(
             f"Hide at frame ≥ {self._current_frame} (current and after)"
         )
-        self._after_radio.setStyleSheet("font-size: 13px;")
+        self._after_radio.setObjectName("objectOptionRadio")
         self._button_group.addButton(self._after_radio, 2)
         layout.addWidget(self._after_radio)
         
@@ -118,6 +107,30 @@ class ObjectDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _add_info_row(self, layout: QVBoxLayout, name: str, value: str):
+        """
+        Add a plain-text "name value" row to the info panel.
+        
+        The value is emphasized through the stylesheet rather than rich
+        text, so neither label goes through the HTML parser.
+        """
+        row = QHBoxLayout()
+        row.setSpacing(4)
+        
+        name_label = QLabel(name)
+        name_label.setObjectName("objectInfoLabel")
+        name_label.setTextFormat(Qt.TextFormat.PlainText)
+        row.addWidget(name_label)
+        
+        value_label = QLabel(value)
+        value_label.setObjectName("objectInfoValue")
+        value_label.setTextFormat(Qt.TextFormat.PlainText)
+        row.addWidget(value_label)
+        
+        row.addStretch()
+        layout.addLayout(row)
+    
+    @pyqtSlot()
     def _on_confirm(self):
         """Handle confirm button click."""
         if self._before_radio.isChecked():
@@ -6,7 +6,7 @@ draggable overlay items.
 """
 
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPointF
-from PyQt6.QtGui import QPixmap, QMouseEvent, QPainter
+from PyQt6.QtGui import QPixmap, QMouseEvent, QPainter, QTransform
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView,
     QGraphicsScene, QGraphicsPixmapItem, QPushButton,
@@ -23,18 +23,22 @@ class PreviewGraphicsView(QGraphicsView):
     Custom graphics view with double-click detection.
     
     Signals:
-        double_clicked(float, float): Double-click position in scene coordinates.
+        double_clicked(int, int): Double-clicked pixel in scene coordinates.
     """
     
-    double_clicked = pyqtSignal(float, float)
+    double_clicked = pyqtSignal(int, int)
+    
+    # Delay after the last resize event before refitting the scene
+    FIT_DEBOUNCE_MS = 30
     
     def __init__(self, parent=None):
         """Initialize preview graphics view."""
         super().__init__(parent)
         
+        # Overlays enable antialiasing in their own paint methods; the
+        # frame pixmap is an axis-aligned blit that does not need it
         self.setRenderHints(
             self.renderHints() |
-            QPainter.RenderHint.Antialiasing |
             QPainter.RenderHint.SmoothPixmapTransform
         )
         
@@ -44,16 +48,35 @@ class PreviewGraphicsView(QGraphicsView):
         
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        
+        # The scene is one frame pixmap plus a few small overlays, so
+        # repainting only the dirty regions is cheaper than a full redraw
+        self.setViewportUpdateMode(
+            QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+        )
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        
+        # Coalesce bursts of resize events into a single refit
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(self.FIT_DEBOUNCE_MS)
+        self._fit_timer.timeout.connect(self.fit_in_view)
     
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         """Handle double-click events."""
         scene_pos = self.mapToScene(event.pos())
-        self.double_clicked.emit(scene_pos.x(), scene_pos.y())
+        self.double_clicked.emit(int(scene_pos.x()), int(scene_pos.y()))
         super().mouseDoubleClickEvent(event)
     
     def resizeEvent(self, event):
         """Handle resize to fit content."""
         super().resizeEvent(event)
+        self._fit_timer.start()
+    
+    def showEvent(self, event):
+        """Fit content immediately so the first paint is correct."""
+        super().showEvent(event)
+        self._fit_timer.stop()
         self.fit_in_view()
     
     def fit_in_view(self):
@@ -74,7 +97,10 @@ class PlaybackControls(QFrame):
         pause_clicked: Pause button clicked.
         prev_clicked: Previous frame button clicked.
         next_clicked: Next frame button clicked.
-        seek_requested(int): Slider position changed.
+        seek_requested(int): Slider position committed.
+        seek_preview_requested(int): Slider dragged to a new position.
+        scrub_started: Slider handle pressed.
+        scrub_ended: Slider handle released.
     """
     
     play_clicked = pyqtSignal()
@@ -82,6 +108,14 @@ class PlaybackControls(QFrame):
     prev_clicked = pyqtSignal()
     next_clicked = pyqtSignal()
     seek_requested = pyqtSignal(int)
+    seek_preview_requested = pyqtSignal(int)
+    scrub_started = pyqtSignal()
+    scrub_ended = pyqtSignal()
+    
+    # Delay before a slider change is dispatched as a seek
+    SEEK_DEBOUNCE_MS = 40
+    # Minimum interval between frame label refreshes (~30 Hz)
+    LABEL_UPDATE_INTERVAL_MS = 33
     
     def __init__(self, parent=None):
         """Initialize playback controls."""
@@ -90,17 +124,14 @@ class PlaybackControls(QFrame):
         self._is_playing = False
         self._frame_count = 0
         self._current_frame = 0
+        self._pending_seek = 0
+        self._label_suffix = " / 0"
         
         self._setup_ui()
     
     def _setup_ui(self):
         """Set up the control bar UI."""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #f5f5f7;
-                border-top: 1px solid #e5e5ea;
-            }
-        """)
+        self.setObjectName("playbackControls")
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -109,7 +140,7 @@ class PlaybackControls(QFrame):
         self._prev_btn = QPushButton("◀")
         self._prev_btn.setFixedSize(24, 32)
         self._prev_btn.setToolTip("Previous Frame")
-        self._prev_btn.clicked.connect(self.prev_clicked.emit)
+        self._prev_btn.clicked.connect(self.prev_clicked)
         layout.addWidget(self._prev_btn)
         
         self._play_btn = QPushButton("▶")
@@ -121,7 +152,7 @@ class PlaybackControls(QFrame):
         self._next_btn = QPushButton("▶")
         self._next_btn.setFixedSize(24, 32)
         self._next_btn.setToolTip("Next Frame")
-        self._next_btn.clicked.connect(self.next_clicked.emit)
+        self._next_btn.clicked.connect(self.next_clicked)
         layout.addWidget(self._next_btn)
         
         layout.addSpacing(8)
@@ -131,12 +162,27 @@ class PlaybackControls(QFrame):
         self._slider.setMaximum(0)
         self._slider.setValue(0)
         self._slider.valueChanged.connect(self._on_slider_changed)
+        self._slider.sliderPressed.connect(self.scrub_started)
+        self._slider.sliderReleased.connect(self._on_slider_released)
         layout.addWidget(self._slider, 1)
         
+        # Coalesce scrub bursts so only the latest position is sought
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(self.SEEK_DEBOUNCE_MS)
+        self._seek_timer.timeout.connect(self._flush_seek)
+        
+        # Cap frame label refreshes during playback to the display rate
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(self.LABEL_UPDATE_INTERVAL_MS)
+        self._label_timer.timeout.connect(self._flush_label)
+        self._label_pending = False
+        
         layout.addSpacing(8)
         
         self._frame_label = QLabel("0 / 0")
-        self._frame_label.setMinimumWidth(75)
+        self._frame_label.setFixedWidth(75)
         self._frame_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._frame_label)
     
@@ -155,26 +201,64 @@ class PlaybackControls(QFrame):
     
     def _on_slider_changed(self, value: int):
         """Handle slider value change."""
-        self.seek_requested.emit(value)
+        self._pending_seek = value
+        self._seek_timer.start()
+    
+    def _on_slider_released(self):
+        """Commit the final position when a drag ends."""
+        self._seek_timer.stop()
+        # End the scrub first so the committed frame is shown at full size
+        self.scrub_ended.emit()
+        self.seek_requested.emit(self._slider.value())
+    
+    def _flush_seek(self):
+        """Emit the latest pending slider position."""
+        # Positions passed while dragging are only previews; the
+        # release commits the final one
+        if self._slider.isSliderDown():
+            self.seek_preview_requested.emit(self._pending_seek)
+        else:
+            self.seek_requested.emit(self._pending_seek)
     
     def set_frame_count(self, count: int):
         """Set total frame count."""
         self._frame_count = count
         self._slider.setMaximum(max(0, count - 1))
+        
+        # Size the label for the widest text so ticking digits never
+        # trigger a relayout of the control bar
+        widest = f"{count} / {count}"
+        width = self._frame_label.fontMetrics().horizontalAdvance(widest) + 16
+        self._frame_label.setFixedWidth(max(75, width))
+        self._label_suffix = f" / {count}"
         self._update_label()
     
     def set_current_frame(self, frame: int):
         """Set current frame without emitting signal."""
+        if frame == self._current_frame:
+            return
         self._current_frame = frame
         self._slider.blockSignals(True)
         self._slider.setValue(frame)
         self._slider.blockSignals(False)
-        self._update_label()
+        
+        # Refresh the label at once, then at most once per interval
+        if self._label_timer.isActive():
+            self._label_pending = True
+        else:
+            self._update_label()
+            self._label_timer.start()
+    
+    def _flush_label(self):
+        """Apply a frame label refresh deferred by the throttle."""
+        if self._label_pending:
+            self._label_pending = False
+            self._update_label()
     
     def _update_label(self):
         """Update frame label."""
         self._frame_label.setText(
-            f"{self._current_frame + 1} / {self._frame_count}"
+            str(self._current_frame + 1) + self._label_suffix
         )
     
     def set_playing(self, playing: bool):
@@ -212,6 +296,9 @@ class PreviewWidget(QWidget):
         
         self._image_width = 0
         self._image_height = 0
+        self._image_cache_key = 0
+        self._scrubbing = False
+        self._image_scaled = False
         self._current_frame = 0
         
         # Store overlay enabled states for visibility control
@@ -233,22 +320,28 @@ class PreviewWidget(QWidget):
         layout.setSpacing(0)
         
         self._scene = QGraphicsScene(self)
+        # A frame plus four overlays is scanned faster linearly than through
+        # a BSP tree that would be rebalanced on every overlay drag
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self._view = PreviewGraphicsView()
         self._view.setScene(self._scene)
         self._view.double_clicked.connect(self._on_double_click)
         
-        # Set white background for preview area
-        self._view.setStyleSheet("background-color: white;")
+        # White background for preview area, styled as #previewView
+        self._view.setObjectName("previewView")
         self._scene.setBackgroundBrush(Qt.GlobalColor.white)
         
         layout.addWidget(self._view, 1)
         
         self._controls = PlaybackControls()
-        self._controls.play_clicked.connect(self.play_requested.emit)
-        self._controls.pause_clicked.connect(self.pause_requested.emit)
+        self._controls.play_clicked.connect(self.play_requested)
+        self._controls.pause_clicked.connect(self.pause_requested)
         self._controls.prev_clicked.connect(self._on_prev_frame)
         self._controls.next_clicked.connect(self._on_next_frame)
-        self._controls.seek_requested.connect(self._on_seek)
+        self._controls.seek_requested.connect(self.frame_changed)
+        self._controls.seek_preview_requested.connect(self.frame_changed)
+        self._controls.scrub_started.connect(self._on_scrub_started)
+        self._controls.scrub_ended.connect(self._on_scrub_ended)
         
         layout.addWidget(self._controls)
         
@@ -256,38 +349,43 @@ class PreviewWidget(QWidget):
         self._scene.addItem(self._image_item)
     
     def _setup_overlay_items(self):
-        """Set up draggable overlay items."""
+        """
+        Set up draggable overlay items.
+        
+        The overlays are created once and stay in the scene; the update_*
+        methods mutate them in place and only toggle their visibility.
+        """
         self._time_label = DraggableTextLabel("time", "0.00 s")
-        self._time_label.position_changed.connect(self._on_label_moved)
+        self._time_label.position_changed.connect(self.label_position_changed)
         self._time_label.setVisible(False)
         self._scene.addItem(self._time_label)
         
         self._scale_bar = DraggableScaleBar("scale_bar")
-        self._scale_bar.position_changed.connect(self._on_label_moved)
+        self._scale_bar.position_changed.connect(self.label_position_changed)
         self._scale_bar.setVisible(False)
         self._scene.addItem(self._scale_bar)
         
         self._speed_label = DraggableTextLabel("speed", "1×")
-        self._speed_label.position_changed.connect(self._on_label_moved)
+        self._speed_label.position_changed.connect(self.label_position_changed)
         self._speed_label.setVisible(False)
         self._scene.addItem(self._speed_label)
         
         self._colorbar = DraggableColorbar("colorbar")
-        self._colorbar.position_changed.connect(self._on_label_moved)
+        self._colorbar.position_changed.connect(self.label_position_changed)
         self._colorbar.setVisible(False)
         self._scene.addItem(self._colorbar)
-    
-    def _on_double_click(self, x: float, y: float):
-        """Handle double-click on scene."""
-        int_x = int(x)
-        int_y = int(y)
         
-        if 0 <= int_x < self._image_width and 0 <= int_y < self._image_height:
-            self.object_double_clicked.emit(self._current_frame, int_x, int_y)
+        self._overlays = {
+            'time': self._time_label,
+            'scale_bar': self._scale_bar,
+            'speed': self._speed_label,
+            'colorbar': self._colorbar
+        }
     
-    def _on_label_moved(self, name: str, rel_x: float, rel_y: float):
-        """Handle label position change."""
-        self.label_position_changed.emit(name, rel_x, rel_y)
+    def _on_double_click(self, x: int, y: int):
+        """Handle double-click on scene."""
+        if 0 <= x < self._image_width and 0 <= y < self._image_height:
+            self.object_double_clicked.emit(self._current_frame, x, y)
     
     def _on_prev_frame(self):
         """Go to previous frame."""
@@ -298,19 +396,60 @@ class PreviewWidget(QWidget):
         """Go to next frame."""
         self.frame_changed.emit(self._current_frame + 1)
     
-    def _on_seek(self, frame: int):
-        """Seek to specific frame."""
-        self.frame_changed.emit(frame)
+    def _on_scrub_started(self):
+        """Show reduced-resolution frames while the slider is dragged."""
+        self._scrubbing = True
+    
+    def _on_scrub_ended(self):
+        """Return to full-resolution frames."""
+        self._scrubbing = False
     
-    def set_image(self, pixmap: QPixmap):
-        """Set the preview image."""
+    @property
+    def is_scrubbing(self) -> bool:
+        """Whether the frame slider is currently being dragged."""
+        return self._scrubbing
+    
+    def set_image(
+        self, pixmap: QPixmap, image_size: tuple[int, int] | None = None
+    ):
+        """
+        Set the preview image.
+        
+        Args:
+            pixmap: Frame to display.
+            image_size: Full-resolution (width, height) when the pixmap is
+                a reduced-size frame; it is stretched over that area.
+        """
+        # Re-setting the same pixmap would still invalidate the viewport
+        cache_key = pixmap.cacheKey()
+        if cache_key == self._image_cache_key:
+            return
+        self._image_cache_key = cache_key
+        
         self._image_item.setPixmap(pixmap)
         
-        if pixmap.width() != self._image_width or pixmap.height() != self._image_height:
-            self._image_width = pixmap.width()
-            self._image_height = pixmap.height()
+        if image_size is None:
+            width = pixmap.width()
+            height = pixmap.height()
+        else:
+            width, height = image_size
+        
+        # Scale reduced frames back over the scene rect, so overlays and
+        # click mapping keep full-size coordinates
+        if width != pixmap.width() or height != pixmap.height():
+            self._image_item.setTransform(QTransform.fromScale(
+                width / pixmap.width(), height / pixmap.height()
+            ))
+            self._image_scaled = True
+        elif self._image_scaled:
+            self._image_item.setTransform(QTransform())
+            self._image_scaled = False
+        
+        if width != self._image_width or height != self._image_height:
+            self._image_width = width
+            self._image_height = height
             
-            self._scene.setSceneRect(0, 0, self._image_width, self._image_height)
+            self._scene.setSceneRect(0, 0, width, height)
             
             self._update_overlay_sizes()
             
@@ -318,10 +457,8 @@ class PreviewWidget(QWidget):
     
     def _update_overlay_sizes(self):
         """Update overlay item sizes for new image dimensions."""
-        self._time_label.set_image_size(self._image_width, self._image_height)
-        self._scale_bar.set_image_size(self._image_width, self._image_height)
-        self._speed_label.set_image_size(self._image_width, self._image_height)
-        self._colorbar.set_image_size(self._image_width, self._image_height)
+        for item in self._overlays.values():
+            item.set_image_size(self._image_width, self._image_height)
     
     def set_frame_count(self, count: int):
         """Set total frame count."""
@@ -345,9 +482,7 @@ class PreviewWidget(QWidget):
         self._time_label.set_font(font, size, bold)
         self._time_label.set_color(color)
         
-        # Store enabled state and apply visibility
-        self._overlay_enabled_states['time'] = visible
-        self._time_label.setVisible(visible and self._overlay_visible)
+        self._set_overlay_enabled('time', visible)
     
     def update_scale_bar(
         self,
@@ -365,6 +500,7 @@ class PreviewWidget(QWidget):
         text_color: str = 'white'
     ):
         """Update scale bar appearance."""
+        self._scale_bar.begin_batch()
         self._scale_bar.set_bar_length(length_px)
         self._scale_bar.set_bar_thickness(thickness)
         self._scale_bar.set_bar_color(bar_color)
@@ -374,10 +510,9 @@ class PreviewWidget(QWidget):
         self._scale_bar.set_text_gap(text_gap)
         self._scale_bar.set_font(font, size, font_bold)
         self._scale_bar.set_text_color(text_color)
+        self._scale_bar.end_batch()
         
-        # Store enabled state and apply visibility
-        self._overlay_enabled_states['scale_bar'] = visible
-        self._scale_bar.setVisible(visible and self._overlay_visible)
+        self._set_overlay_enabled('scale_bar', visible)
     
     def update_speed_label(
         self, text: str, visible: bool, font: str, size: int,
@@ -388,9 +523,7 @@ class PreviewWidget(QWidget):
         self._speed_label.set_font(font, size, bold)
         self._speed_label.set_color(color)
         
-        # Store enabled state and apply visibility
-        self._overlay_enabled_states['speed'] = visible
-        self._speed_label.setVisible(visible and self._overlay_visible)
+        self._set_overlay_enabled('speed', visible)
     
     def update_colorbar(
         self,
@@ -417,6 +550,7 @@ class PreviewWidget(QWidget):
         tick_length: int
     ):
         """Update colorbar appearance."""
+        self._colorbar.begin_batch()
         self._colorbar.set_bar_size(bar_width, bar_height)
         self._colorbar.set_colormap_image(colormap_image)
         self._colorbar.set_title(title)
@@ -431,32 +565,29 @@ class PreviewWidget(QWidget):
         self._colorbar.set_tick_color(tick_color)
         self._colorbar.set_border_thickness(border_thickness)
         self._colorbar.set_tick_style(tick_thickness, tick_length)
+        self._colorbar.end_batch()
         
-        # Store enabled state and apply visibility
-        self._overlay_enabled_states['colorbar'] = visible
-        self._colorbar.setVisible(visible and self._overlay_visible)
+        self._set_overlay_enabled('colorbar', visible)
+    
+    def _set_overlay_enabled(self, name: str, enabled: bool):
+        """Store an overlay's enabled state and apply its visibility."""
+        self._overlay_enabled_states[name] = enabled
+        visible = enabled and self._overlay_visible
+        item = self._overlays[name]
+        if item.isVisible() != visible:
+            item.setVisible(visible)
     
     def set_label_position(self, name: str, rel_x: float, rel_y: float):
         """Set label position."""
-        if name == "time":
-            self._time_label.set_relative_position(rel_x, rel_y)
-        elif name == "scale_bar":
-            self._scale_bar.set_relative_position(rel_x, rel_y)
-        elif name == "speed":
-            self._speed_label.set_relative_position(rel_x, rel_y)
-        elif name == "colorbar":
-            self._colorbar.set_relative_position(rel_x, rel_y)
+        item = self._overlays.get(name)
+        if item is not None:
+            item.set_relative_position(rel_x, rel_y)
     
     def get_label_position(self, name: str) -> tuple[float, float]:
         """Get label position."""
-        if name == "time":
-            return self._time_label.get_relative_position()
-        elif name == "scale_bar":
-            return self._scale_bar.get_relative_position()
-        elif name == "speed":
-            return self._speed_label.get_relative_position()
-        elif name == "colorbar":
-            return self._colorbar.get_relative_position()
+        item = self._overlays.get(name)
+        if item is not None:
+            return item.get_relative_position()
         return (0.0, 0.0)
     
     def set_overlay_visibility(self, visible: bool):
@@ -471,15 +602,7 @@ class PreviewWidget(QWidget):
         """
         self._overlay_visible = visible
         
-        if visible:
-            # Restore visibility based on enabled states
-            self._time_label.setVisible(self._overlay_enabled_states['time'])
-            self._scale_bar.setVisible(self._overlay_enabled_states['scale_bar'])
-            self._speed_label.setVisible(self._overlay_enabled_states['speed'])
-            self._colorbar.setVisible(self._overlay_enabled_states['colorbar'])
-        else:
-            # Hide all overlays
-            self._time_label.setVisible(False)
-            self._scale_bar.setVisible(False)
-            self._speed_label.setVisible(False)
-            self._colorbar.setVisible(False)
\ No newline at end of file
+        for name, item in self._overlays.items():
+            item_visible = visible and self._overlay_enabled_states[name]
+            if item.isVisible() != item_visible:
+                item.setVisible(item_visible)
@@ -4,7 +4,7 @@ Progress dialog for export operations.
 Shows export progress with estimated remaining time and cancel option.
 """
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QProgressBar, QPushButton
@@ -20,6 +20,9 @@ class ProgressDialog(QDialog):
     Shows progress bar, current status, and cancel button.
     """
     
+    # Interval at which pending progress is applied to the widgets (~20 Hz)
+    UI_UPDATE_INTERVAL_MS = 50
+    
     def __init__(self, title: str = "Processing...", parent=None):
         """
         Initialize progress dialog.
@@ -32,7 +35,16 @@ class ProgressDialog(QDialog):
         
         self._cancelled = False
         
+        # Latest reported values, applied to the widgets by _flush_ui
+        self._pending_percent = 0
+        self._pending_time = ""
+        self._pending_status: str | None = None
+        
         self._setup_ui(title)
+        
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(self.UI_UPDATE_INTERVAL_MS)
+        self._ui_timer.timeout.connect(self._flush_ui)
     
     def _setup_ui(self, title: str):
         """Set up the dialog UI."""
@@ -50,11 +62,7 @@ class ProgressDialog(QDialog):
         layout.setContentsMargins(24, 24, 24, 24)
         
         self._title_label = QLabel(title)
-        self._title_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1d1d1f;
-        """)
+        self._title_label.setObjectName("progressTitleLabel")
         layout.addWidget(self._title_label)
         
         progress_layout = QHBoxLayout()
@@ -64,23 +72,13 @@ class ProgressDialog(QDialog):
         self._progress_bar.setMaximum(100)
         self._progress_bar.setValue(0)
         self._progress_bar.setTextVisible(False)
-        self._progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #e5e5ea;
-                border-radius: 6px;
-                height: 12px;
-            }
-            QProgressBar::chunk {
-                background-color: #0071e3;
-                border-radius: 6px;
-            }
-        """)
+        self._progress_bar.setObjectName("progressDialogBar")
         progress_layout.addWidget(self._progress_bar)
         
         self._percent_label = QLabel("0%")
         self._percent_label.setMinimumWidth(50)
         self._percent_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        self._percent_label.setStyleSheet("font-size: 14px; font-weight: 600;")
+        self._percent_label.setObjectName("progressPercentLabel")
         progress_layout.addWidget(self._percent_label)
         
         layout.addLayout(progress_layout)
@@ -89,11 +87,11 @@ class ProgressDialog(QDialog):
         status_layout.setSpacing(8)
         
         self._status_label = QLabel("Preparing...")
-        self._status_label.setStyleSheet("color: #666;")
+        self._status_label.setObjectName("progressDetailLabel")
         status_layout.addWidget(self._status_label)
         
         self._time_label = QLabel("Estimated time remaining: Calculating...")
-        self._time_label.setStyleSheet("color: #666;")
+        self._time_label.setObjectName("progressDetailLabel")
         status_layout.addWidget(self._time_label)
         
         layout.addLayout(status_layout)
@@ -110,6 +108,44 @@ class ProgressDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def reset(self, title: str):
+        """
+        Prepare the dialog for a new operation.
+        
+        Args:
+            title: Dialog title.
+        """
+        self._cancelled = False
+        self._pending_percent = 0
+        self._pending_time = ""
+        self._pending_status = None
+        
+        self.setWindowTitle(title)
+        self._title_label.setText(title)
+        self._progress_bar.setValue(0)
+        self._percent_label.setText("0%")
+        self._status_label.setText("Preparing...")
+        self._time_label.setText("Estimated time remaining: Calculating...")
+        
+        self._cancel_btn.setText("Cancel")
+        self._cancel_btn.setEnabled(True)
+        self._cancel_btn.clicked.disconnect()
+        self._cancel_btn.clicked.connect(self._on_cancel)
+        
+        # A dialog left open from the last export gets no new showEvent
+        if self.isVisible():
+            self._ui_timer.start()
+    
+    def showEvent(self, event):
+        """Start applying progress updates while the dialog is shown."""
+        super().showEvent(event)
+        self._ui_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop the progress refresh timer while the dialog is hidden."""
+        super().hideEvent(event)
+        self._ui_timer.stop()
+    
     def _on_cancel(self):
         """Handle cancel button click."""
         self._cancelled = True
@@ -125,11 +161,9 @@ class ProgressDialog(QDialog):
             percent: Progress percentage (0-100).
             remaining_time: Formatted remaining time string.
         """
-        self._progress_bar.setValue(percent)
-        self._percent_label.setText(f"{percent}%")
-        
+        self._pending_percent = percent
         if remaining_time:
-            self._time_label.setText(f"Estimated time remaining: {remaining_time}")
+            self._pending_time = remaining_time
     
     def update_status(self, status: str):
         """
@@ -148,7 +182,24 @@ class ProgressDialog(QDialog):
             current: Current frame number.
             total: Total frame count.
         """
-        self._status_label.setText(f"Processing frame {current} / {total}")
+        self._pending_status = f"Processing frame {current} / {total}"
+    
+    def _flush_ui(self):
+        """Apply the latest reported progress to the widgets."""
+        percent = self._pending_percent
+        if percent != self._progress_bar.value():
+            self._progress_bar.setValue(percent)
+            self._percent_label.setText(f"{percent}%")
+        
+        if self._pending_time:
+            self._time_label.setText(
+                f"Estimated time remaining: {self._pending_time}"
+            )
+            self._pending_time = ""
+        
+        if self._pending_status is not None:
+            self._status_label.setText(self._pending_status)
+            self._pending_status = None
     
     def is_cancelled(self) -> bool:
         """Check if cancel was requested."""
@@ -162,6 +213,8 @@ class ProgressDialog(QDialog):
             success: Whether operation completed successfully.
             message: Completion message.
         """
+        self._ui_timer.stop()
+        
         if success:
             self._progress_bar.setValue(100)
             self._percent_label.setText("100%")
@@ -4,23 +4,42 @@ Application styles and themes.
 Defines macOS-inspired light theme stylesheet for PyQt6.
 """
 
-MACOS_LIGHT_STYLE = """
+import re
+from functools import lru_cache
+from string import Template
+
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QApplication
+
+
+# Theme colors substituted into the stylesheet template below
+_PALETTE = {
+    'accent': '#0071e3',
+    'background': '#f5f5f7',
+    'surface': '#ffffff',
+    'border': '#d2d2d7',
+    'separator': '#e5e5ea',
+    'pressed': '#e8e8ed',
+    'text': '#1d1d1f',
+    'disabled_text': '#8e8e93',
+    'inverse_text': '#ffffff',
+}
+
+_STYLE_TEMPLATE = Template("""
 /* Main Window */
 QMainWindow {
-    background-color: #f5f5f7;
+    background-color: $background;
 }
 
-/* General Widget */
+/* General Widget (the default font is set by apply_default_font) */
 QWidget {
-    font-family: -apple-system, BlinkMacSystemFont, "SF Pro Text", "Helvetica Neue", Arial, sans-serif;
-    font-size: 13px;
-    color: #1d1d1f;
+    color: $text;
 }
 
 /* Menu Bar */
 QMenuBar {
-    background-color: #f5f5f7;
-    border-bottom: 1px solid #d2d2d7;
+    background-color: $background;
+    border-bottom: 1px solid $border;
     padding: 4px;
 }
 
@@ -31,12 +50,12 @@ QMenuBar::item {
 }
 
 QMenuBar::item:selected {
-    background-color: #e8e8ed;
+    background-color: $pressed;
 }
 
 QMenu {
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 8px;
     padding: 4px;
 }
@@ -47,13 +66,13 @@ QMenu::item {
 }
 
 QMenu::item:selected {
-    background-color: #0071e3;
-    color: #ffffff;
+    background-color: $accent;
+    color: $inverse_text;
 }
 
 /* Scroll Area */
 QScrollArea {
-    background-color: #f5f5f7;
+    background-color: $background;
     border: none;
 }
 
@@ -103,8 +122,8 @@ QScrollBar::sub-line:horizontal {
 
 /* Group Box */
 QGroupBox {
-    background-color: #ffffff;
-    border: 1px solid #e5e5ea;
+    background-color: $surface;
+    border: 1px solid $separator;
     border-radius: 10px;
     margin-top: 16px;
     padding: 16px;
@@ -116,47 +135,37 @@ QGroupBox::title {
     subcontrol-position: top left;
     left: 16px;
     padding: 0 8px;
-    color: #1d1d1f;
     font-weight: 600;
     font-size: 14px;
 }
 
-/* Labels */
-QLabel {
-    color: #1d1d1f;
-    background-color: transparent;
+QGroupBox#parameterGroup {
+    font-size: 14px;
+    font-weight: bold;
+    max-width: 310px;
 }
 
 /* Line Edit */
 QLineEdit {
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 6px;
     padding: 6px 10px;
-    selection-background-color: #0071e3;
-}
-
-QLineEdit:focus {
-    border: 2px solid #0071e3;
-    padding: 5px 9px;
-}
-
-QLineEdit:disabled {
-    background-color: #f5f5f7;
-    color: #8e8e93;
+    selection-background-color: $accent;
 }
 
 /* Spin Box */
 QSpinBox, QDoubleSpinBox {
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 6px;
     padding: 6px 10px;
     min-width: 80px;
 }
 
-QSpinBox:focus, QDoubleSpinBox:focus {
-    border: 2px solid #0071e3;
+/* Text inputs share one focus ring */
+QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
+    border: 2px solid $accent;
     padding: 5px 9px;
 }
 
@@ -169,15 +178,15 @@ QSpinBox::down-button, QDoubleSpinBox::down-button {
 
 /* Combo Box */
 QComboBox {
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 6px;
     padding: 6px 10px;
     min-width: 100px;
 }
 
 QComboBox:focus {
-    border: 2px solid #0071e3;
+    border: 2px solid $accent;
 }
 
 QComboBox::drop-down {
@@ -191,11 +200,11 @@ QComboBox::down-arrow {
 }
 
 QComboBox QAbstractItemView {
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 8px;
-    selection-background-color: #0071e3;
-    selection-color: #ffffff;
+    selection-background-color: $accent;
+    selection-color: $inverse_text;
 }
 
 /* Check Box */
@@ -207,17 +216,17 @@ QCheckBox::indicator {
     width: 18px;
     height: 18px;
     border-radius: 4px;
-    border: 1px solid #d2d2d7;
-    background-color: #ffffff;
+    border: 1px solid $border;
+    background-color: $surface;
 }
 
 QCheckBox::indicator:checked {
-    background-color: #0071e3;
-    border-color: #0071e3;
+    background-color: $accent;
+    border-color: $accent;
 }
 
 QCheckBox::indicator:hover {
-    border-color: #0071e3;
+    border-color: $accent;
 }
 
 /* Radio Button */
@@ -229,20 +238,20 @@ QRadioButton::indicator {
     width: 18px;
     height: 18px;
     border-radius: 9px;
-    border: 1px solid #d2d2d7;
-    background-color: #ffffff;
+    border: 1px solid $border;
+    background-color: $surface;
 }
 
 QRadioButton::indicator:checked {
-    background-color: #0071e3;
-    border: 5px solid #ffffff;
-    outline: 1px solid #0071e3;
+    background-color: $accent;
+    border: 5px solid $surface;
+    outline: 1px solid $accent;
 }
 
 /* Push Button */
 QPushButton {
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 6px;
     padding: 8px 16px;
     font-weight: 500;
@@ -250,22 +259,23 @@ QPushButton {
 }
 
 QPushButton:hover {
-    background-color: #f5f5f7;
+    background-color: $background;
 }
 
 QPushButton:pressed {
-    background-color: #e8e8ed;
+    background-color: $pressed;
 }
 
-QPushButton:disabled {
-    background-color: #f5f5f7;
-    color: #8e8e93;
+/* Disabled inputs and buttons */
+QLineEdit:disabled, QPushButton:disabled {
+    background-color: $background;
+    color: $disabled_text;
 }
 
 QPushButton#primaryButton {
-    background-color: #0071e3;
-    border-color: #0071e3;
-    color: #ffffff;
+    background-color: $accent;
+    border-color: $accent;
+    color: $inverse_text;
 }
 
 QPushButton#primaryButton:hover {
@@ -276,10 +286,85 @@ QPushButton#primaryButton:pressed {
     background-color: #006edb;
 }
 
+/* Preview Toolbar */
+QWidget#previewToolbar {
+    background-color: #f0f0f0;
+    border-bottom: 1px solid #d0d0d0;
+}
+
+QWidget#previewToolbar QPushButton {
+    padding: 6px 12px;
+    border: 1px solid #c0c0c0;
+    border-radius: 4px;
+    background-color: $surface;
+    font-size: 12px;
+}
+
+QWidget#previewToolbar QPushButton:hover {
+    background-color: #e8e8e8;
+}
+
+QWidget#previewToolbar QPushButton:checked {
+    background-color: #0078d4;
+    color: white;
+    border-color: #0078d4;
+}
+
+/* Object Dialog */
+QWidget#objectInfoFrame,
+QWidget#objectInfoFrame QLabel {
+    background-color: #f0f0f5;
+    border-radius: 8px;
+    padding: 12px;
+}
+
+QLabel#objectInfoLabel {
+    font-size: 14px;
+}
+
+QWidget#objectInfoFrame QLabel#objectInfoLabel {
+    padding-right: 0px;
+}
+
+QWidget#objectInfoFrame QLabel#objectInfoValue {
+    font-size: 14px;
+    font-weight: bold;
+    padding-left: 0px;
+}
+
+QLabel#objectOptionLabel {
+    font-size: 14px;
+    font-weight: 600;
+}
+
+QRadioButton#objectOptionRadio {
+    font-size: 13px;
+}
+
+/* Dialog and panel labels */
+QLabel#sectionLabel {
+    font-weight: 600;
+}
+
+QLabel#valueLabel {
+    color: #0066cc;
+    font-weight: bold;
+}
+
+QLabel#hintLabel,
+QLabel#indentedHintLabel {
+    color: #666;
+    font-style: italic;
+}
+
+QLabel#indentedHintLabel {
+    margin-left: 105px;
+}
+
 /* Slider */
 QSlider::groove:horizontal {
     height: 4px;
-    background-color: #e5e5ea;
+    background-color: $separator;
     border-radius: 2px;
 }
 
@@ -287,60 +372,61 @@ QSlider::handle:horizontal {
     width: 12px;
     height: 12px;
     margin: -4px 0;
-    background-color: #ffffff;
-    border: 1px solid #d2d2d7;
+    background-color: $surface;
+    border: 1px solid $border;
     border-radius: 6px;
 }
 
 QSlider::handle:horizontal:hover {
-    border-color: #0071e3;
+    border-color: $accent;
 }
 
 QSlider::sub-page:horizontal {
-    background-color: #0071e3;
+    background-color: $accent;
     border-radius: 2px;
 }
 
 /* Progress Bar */
 QProgressBar {
-    background-color: #e5e5ea;
+    background-color: $separator;
     border-radius: 4px;
     height: 8px;
     text-align: center;
 }
 
 QProgressBar::chunk {
-    background-color: #0071e3;
+    background-color: $accent;
     border-radius: 4px;
 }
 
-/* Tab Widget */
-QTabWidget::pane {
-    background-color: #ffffff;
-    border: 1px solid #e5e5ea;
-    border-radius: 8px;
+/* Progress Dialog */
+QProgressBar#progressDialogBar {
+    border-radius: 6px;
+    height: 12px;
 }
 
-QTabBar::tab {
-    background-color: transparent;
-    padding: 8px 16px;
-    margin-right: 4px;
+QProgressBar#progressDialogBar::chunk {
     border-radius: 6px;
 }
 
-QTabBar::tab:selected {
-    background-color: #ffffff;
-    border: 1px solid #e5e5ea;
+QLabel#progressTitleLabel {
+    font-size: 16px;
+    font-weight: 600;
+}
+
+QLabel#progressPercentLabel {
+    font-size: 14px;
+    font-weight: 600;
 }
 
-QTabBar::tab:hover:!selected {
-    background-color: #f5f5f7;
+QLabel#progressDetailLabel {
+    color: #666;
 }
 
 /* List Widget */
 QListWidget {
-    background-color: #ffffff;
-    border: 1px solid #e5e5ea;
+    background-color: $surface;
+    border: 1px solid $separator;
     border-radius: 8px;
     padding: 4px;
 }
@@ -351,17 +437,17 @@ QListWidget::item {
 }
 
 QListWidget::item:selected {
-    background-color: #0071e3;
-    color: #ffffff;
+    background-color: $accent;
+    color: $inverse_text;
 }
 
 QListWidget::item:hover:!selected {
-    background-color: #f5f5f7;
+    background-color: $background;
 }
 
 /* Splitter */
 QSplitter::handle {
-    background-color: #e5e5ea;
+    background-color: $separator;
 }
 
 QSplitter::handle:horizontal {
@@ -374,20 +460,20 @@ QSplitter::handle:vertical {
 
 /* Status Bar */
 QStatusBar {
-    background-color: #f5f5f7;
-    border-top: 1px solid #e5e5ea;
+    background-color: $background;
+    border-top: 1px solid $separator;
     padding: 4px;
 }
 
 /* Dialog */
 QDialog {
-    background-color: #f5f5f7;
+    background-color: $background;
 }
 
 /* Tool Tip */
 QToolTip {
-    background-color: #1d1d1f;
-    color: #ffffff;
+    background-color: $text;
+    color: $inverse_text;
     border: none;
     border-radius: 4px;
     padding: 6px 10px;
@@ -396,17 +482,72 @@ QToolTip {
 /* Graphics View */
 QGraphicsView {
     background-color: #2c2c2e;
-    border: 1px solid #e5e5ea;
+    border: 1px solid $separator;
     border-radius: 8px;
 }
-"""
+
+QGraphicsView#previewView {
+    background-color: white;
+}
+
+/* Playback Controls */
+QFrame#playbackControls,
+QFrame#playbackControls QFrame {
+    background-color: $background;
+    border-top: 1px solid $separator;
+}
+""")
+
+MACOS_LIGHT_STYLE = _STYLE_TEMPLATE.substitute(_PALETTE)
+
+
+# Default UI font, applied once to the application rather than via QSS
+DEFAULT_FONT_FAMILIES = ["SF Pro Text", "Helvetica Neue", "Arial"]
+DEFAULT_FONT_PIXEL_SIZE = 13
+
+
+def _minify_qss(source: str) -> str:
+    """
+    Strip comments, whitespace and redundant semicolons from a stylesheet.
+    
+    Args:
+        source: Stylesheet source.
+        
+    Returns:
+        Compact stylesheet with the same rules.
+    """
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};:,])\s*", r"\1", source)
+    return source.replace(";}", "}").strip()
 
 
+@lru_cache(maxsize=1)
 def get_application_style() -> str:
     """
     Get the application stylesheet.
     
+    The stylesheet is minified on the first call, so Qt's parser scans
+    fewer characters, and the result is reused afterwards.
+    
     Returns:
         CSS stylesheet string.
     """
-    return MACOS_LIGHT_STYLE
+    return _minify_qss(MACOS_LIGHT_STYLE)
+
+
+def apply_default_font(app: QApplication):
+    """
+    Set the application-wide default font.
+    
+    Qt resolves the application font once, whereas a font rule on the
+    QWidget selector is matched for every widget in the tree.
+    
+    Args:
+        app: Application instance.
+    """
+    font = QFont()
+    font.setFamilies(DEFAULT_FONT_FAMILIES)
+    font.setStyleHint(QFont.StyleHint.SansSerif)
+    font.setPixelSize(DEFAULT_FONT_PIXEL_SIZE)
+    app.setFont(font)